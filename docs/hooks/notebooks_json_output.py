@@ -2,18 +2,24 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+import hashlib
 import html
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import nbformat as nbf
+CACHE_FILE_NAME = ".notebooks-cache.json"
 
 
 def on_pre_build(config):
     """
     Runs the updates once before the build of the documentation
 
+    Notebooks that have not changed since the last build are skipped.
+    This keeps `mkdocs serve` rebuilds fast.
+
     References:
     - mkdocs hooks: https://www.mkdocs.org/user-guide/configuration/?#hooks
     - mkdocs events: https://www.mkdocs.org/dev-guide/plugins/#on_pre_build
@@ -27,26 +33,96 @@ def on_pre_build(config):
     _update_files_in_docs(source, destination)
     print(f"[hooks] Updated notebooks: {source} to {destination}")
 
-    for ipynb in destination.rglob("*.ipynb"):
-        if _patch_notebook(ipynb):
-            print(f"[hooks] Patched: {ipynb}")
+    cache_path = destination / CACHE_FILE_NAME
+    cache = _read_cache(cache_path)
+    new_cache = {}
+    changed = []
+    for ipynb in sorted(source.rglob("*.ipynb")):
+        name = ipynb.relative_to(source).as_posix()
+        target = destination / name
+        entry = cache.get(name)
+        if (
+            entry is not None
+            and target.exists()
+            and entry.get("source") == _hash_file(ipynb)
+            and entry.get("target") == _hash_file(target)
+        ):
+            new_cache[name] = entry
+        else:
+            changed.append((name, ipynb, target))
+
+    for name, patched, entry in _process_notebooks(changed):
+        new_cache[name] = entry
+        if patched:
+            print(f"[hooks] Patched: {destination / name}")
+    print(f"[hooks] Skipped {len(new_cache) - len(changed)} unchanged notebook(s)")
+
+    _write_cache(cache_path, new_cache)
+
+
+def _process_notebooks(changed: list[tuple[str, Path, Path]]):
+    """
+    Patches the given notebooks, in parallel worker threads if
+    there are multiple.
+
+    Threads are used because mkdocs loads hooks by file path, so
+    worker processes could not unpickle the functions of this module.
 
+    Args:
+        - changed: list of (name, source path, destination path)
 
-def _patch_notebook(path: Path):
+    Returns:
+        - list of (name, patched, cache entry)
+    """
+    if len(changed) <= 1:
+        return [_process_notebook(*args) for args in changed]
+    max_workers = min(len(changed), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_process_notebook, *zip(*changed)))
+
+
+def _process_notebook(name: str, source: Path, destination: Path):
+    """
+    Copies a notebook to docs/ and patches it.
+
+    Args:
+        - name: notebook name relative to the notebooks directory
+        - source: Path to the original notebook
+        - destination: Path to the notebook in docs/
+
+    Returns:
+        - tuple of name, patching indicator, and the new cache entry
+    """
+    source_hash = _hash_file(source)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    patched = _patch_notebook(source, destination)
+    if not patched:
+        shutil.copyfile(source, destination)
+    entry = {"source": source_hash, "target": _hash_file(destination)}
+    return name, patched, entry
+
+
+def _patch_notebook(source: Path, destination: Path):
     """
     Changes the output type of Jupyter notebook cells from
     `json/application` to `text/html` to make the output readable
     in mkdocs documentation
 
+    The notebook is read as plain JSON and, if patched, streamed into
+    `destination` without validating it. Unpatched notebooks are not
+    written at all.
+
     Args:
-        - path: Path to notebooks in docs/
+        - source: Path to the original notebook
+        - destination: Path to the notebook in docs/
 
     Returns:
         - boolean indicator to report if notebook patching was done
     """
-    nb = nbf.read(path, as_version=4)
+    with source.open(encoding="utf-8") as f:
+        nb = json.load(f)
     changed = False
-    for cell in nb.cells:
+    for cell in nb.get("cells", []):
         for out in cell.get("outputs", []):
             data = out.get("data", {})
             if isinstance(data, dict) and "application/json" in data:
@@ -58,17 +134,42 @@ def _patch_notebook(path: Path):
                 )
                 changed = True
     if changed:
-        nbf.write(nb, path)
+        # Same layout as written by nbformat
+        with destination.open("w", encoding="utf-8") as f:
+            json.dump(nb, f, indent=1, sort_keys=True, ensure_ascii=False)
+            f.write("\n")
     return changed
 
 
 def _update_files_in_docs(source: Path, destination: Path):
     """
-    Adds notebooks to docs/notebooks
+    Adds the files accompanying the notebooks to docs/notebooks.
+    The notebooks themselves are added by `_process_notebook()`.
 
     Args:
         - source: Path to original notebooks
         - destination: Path to copy original notebooks to prepare for and add to
         mkdocs documentation
     """
-    shutil.copytree(source, destination, dirs_exist_ok=True)
+    shutil.copytree(
+        source,
+        destination,
+        ignore=shutil.ignore_patterns("*.ipynb"),
+        dirs_exist_ok=True,
+    )
+
+
+def _hash_file(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _read_cache(cache_path: Path) -> dict:
+    try:
+        return json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache_path: Path, cache: dict):
+    cache_path.write_text(json.dumps(cache, indent=2, sort_keys=True))
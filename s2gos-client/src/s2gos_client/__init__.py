@@ -12,6 +12,9 @@ from .api import (
     create_async_client,
     create_client,
 )
+from .cache import JobCache
+from .estimates import CostEstimate, async_estimate_process, estimate_process
+from .logs import JobLogChunk, follow_job_logs, get_job_logs
 
 __version__ = version("s2gos-client")
 
@@ -20,7 +23,14 @@ __all__ = [
     "Client",
     "ClientConfig",
     "ClientError",
+    "CostEstimate",
+    "JobCache",
+    "JobLogChunk",
+    "async_estimate_process",
     "create_async_client",
     "create_client",
+    "estimate_process",
+    "follow_job_logs",
+    "get_job_logs",
     "__version__",
 ]
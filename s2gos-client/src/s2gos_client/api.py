@@ -5,12 +5,15 @@
 import os
 from importlib.resources import files
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
 from cuiman.api import AsyncClient, Client, ClientConfig, ClientError
 from cuiman.api.auth import login_for_tokens
+from cuiman.api.transport.httpx import HttpxTransport
 from pydantic_settings import SettingsConfigDict
 
+from .cache import DEFAULT_MAX_SIZE, CachingTransport, JobCache
+
 
 class S2GOSConfig(ClientConfig):
     model_config = SettingsConfigDict(
@@ -19,6 +22,11 @@ class S2GOSConfig(ClientConfig):
         extra="allow",  # ClientConfig uses "forbid"
     )
 
+    cache_dir: Optional[str] = None
+    """Directory of the cache of finished jobs, see `JobCache`."""
+    cache_size: Optional[int] = None
+    """Maximum size of the cache of finished jobs in bytes, `0` disables it."""
+
 
 _CONFIG_BASE = S2GOSConfig(
     api_url="https://s2gos.wraptile.brockmann-consult.de/",
@@ -33,6 +41,8 @@ _CONFIG_BASE = S2GOSConfig(
 )
 _DEBUG = False
 
+_JOB_CACHES: dict[tuple[Optional[str], Optional[int]], JobCache] = {}
+
 ClientConfig.default_path = Path("~").expanduser() / ".s2gos-client"
 ClientConfig.default_config = _CONFIG_BASE
 
@@ -63,6 +73,53 @@ def _create_config(**config_overrides: Any) -> ClientConfig:
     return config
 
 
+def _create_transport(config: ClientConfig) -> Optional[CachingTransport]:
+    """
+    Create a transport that serves finished jobs from the job cache,
+    or `None` if the cache is disabled.
+    """
+    cache_dir, cache_size = (
+        (config.cache_dir, config.cache_size)
+        if isinstance(config, S2GOSConfig)
+        else (None, None)
+    )
+    if cache_size == 0:
+        return None
+    cache_key = cache_dir, cache_size
+    job_cache = _JOB_CACHES.get(cache_key)
+    if job_cache is None:
+        job_cache = JobCache(
+            cache_dir=cache_dir,
+            max_size=DEFAULT_MAX_SIZE if cache_size is None else cache_size,
+        )
+        _JOB_CACHES[cache_key] = job_cache
+    # Like the transports of Client and AsyncClient, but serves both
+    # noinspection PyProtectedMember
+    transport = HttpxTransport(
+        api_url=f"{str(config.api_url).rstrip('/')}/",
+        headers=config.auth_headers,
+        return_type_map=config.return_type_map,
+        token_refresher=config._maybe_make_token_refresher(),
+        async_token_refresher=config._make_async_token_refresher(),
+        debug=_DEBUG,
+    )
+    return CachingTransport(
+        transport, job_cache, api_url=str(config.api_url), user=_get_user(config)
+    )
+
+
+def _get_user(config: ClientConfig) -> Optional[str]:
+    """Get the identity of the user authenticated by `config`, if any."""
+    if config.auth_type in ("basic", "login"):
+        # Login tokens change with every session
+        return f"{config.auth_type}:{config.username}"
+    if config.auth_type == "token":
+        return f"token:{config.token}"
+    if config.auth_type == "api-key":
+        return f"api-key:{config.api_key}"
+    return None
+
+
 def create_client(**config: Any) -> Client:
     """Create a synchronous S2GOS client from given configuration.
 
@@ -78,7 +135,8 @@ def create_client(**config: Any) -> Client:
         An instance of a synchronous cuiman client for S2GOS. See
         https://eo-tools.github.io/eozilla/cuiman/ for details.
     """
-    return Client(config=_create_config(**config), _debug=_DEBUG)
+    config_ = _create_config(**config)
+    return Client(config=config_, _debug=_DEBUG, _transport=_create_transport(config_))
 
 
 def create_async_client(**config: Any) -> AsyncClient:
@@ -96,7 +154,10 @@ def create_async_client(**config: Any) -> AsyncClient:
         An instance of an asynchronous cuiman client for S2GOS. See
         https://eo-tools.github.io/eozilla/cuiman/ for details.
     """
-    return AsyncClient(config=_create_config(**config), _debug=_DEBUG)
+    config_ = _create_config(**config)
+    return AsyncClient(
+        config=config_, _debug=_DEBUG, _transport=_create_transport(config_)
+    )
 
 
 __all__ = [
@@ -0,0 +1,245 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Batch submission of execution request files.
+
+Request files are submitted concurrently using a single client, so all
+requests share one authenticated HTTP session. Progress is checkpointed
+to a state file after every submission. If a batch is run again with
+the same state file, request files that have already been submitted
+and have not changed since are skipped.
+"""
+
+import glob
+import hashlib
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from cuiman.api import Client
+from gavicore.models import JobInfo, JobStatus
+from gavicore.util.request import ExecutionRequest
+from pydantic import BaseModel, Field
+
+REQUEST_FILE_SUFFIXES = (".json", ".yaml", ".yml")
+DEFAULT_STATE_PATH = "s2gos-batch-state.json"
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_POLL_INTERVAL = 2.0
+
+_TERMINAL_STATUSES = (JobStatus.successful, JobStatus.failed, JobStatus.dismissed)
+
+
+class BatchEntry(BaseModel):
+    """The outcome of submitting a single request file."""
+
+    requestFile: str = Field(description="Path of the request file")
+    sha256: str = Field(description="Checksum of the request file's content")
+    processID: Optional[str] = Field(default=None, description="Process identifier")
+    jobID: Optional[str] = Field(
+        default=None, description="Job identifier, if submitted"
+    )
+    status: Optional[JobStatus] = Field(
+        default=None, description="Last known job status"
+    )
+    error: Optional[str] = Field(default=None, description="Error message, if failed")
+
+
+class BatchState(BaseModel):
+    """The persisted state of a batch, keyed by request file path."""
+
+    entries: dict[str, BatchEntry] = Field(default_factory=dict)
+
+
+class BatchReport(BaseModel):
+    """The results manifest of a batch run."""
+
+    entries: list[BatchEntry] = Field(description="Outcome per request file")
+    submitted: int = Field(description="Number of requests submitted by this run")
+    skipped: int = Field(description="Number of requests submitted by earlier runs")
+    failed: int = Field(description="Number of requests that could not be submitted")
+    elapsed: float = Field(description="Seconds spent submitting requests")
+    throughput: float = Field(description="Submitted requests per second")
+
+
+def find_request_files(sources: Iterable[str | Path]) -> list[Path]:
+    """
+    Find execution request files.
+
+    Args:
+        sources: Request files, directories that contain request
+            files, or glob patterns.
+
+    Returns:
+        The request files in a stable order, without duplicates,
+        also if they are given by different paths.
+
+    Raises:
+        FileNotFoundError: If a source matches no request file.
+    """
+    # The resolved path of every request file, and the path it was found by
+    paths: dict[Path, Path] = {}
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            matches = [
+                p
+                for p in sorted(path.iterdir())
+                if p.is_file() and p.suffix.lower() in REQUEST_FILE_SUFFIXES
+            ]
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = [Path(p) for p in sorted(glob.glob(str(source), recursive=True))]
+            matches = [p for p in matches if p.is_file()]
+        if not matches:
+            raise FileNotFoundError(f"No request files found for {str(source)!r}")
+        for match in matches:
+            paths.setdefault(match.resolve(), match)
+    return list(paths.values())
+
+
+def run_batch(
+    client: Client,
+    request_files: Iterable[str | Path],
+    state_path: str | Path = DEFAULT_STATE_PATH,
+    manifest_path: Optional[str | Path] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    wait: bool = False,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    on_entry: Optional[Callable[[BatchEntry], None]] = None,
+) -> BatchReport:
+    """
+    Submit execution request files concurrently.
+
+    Args:
+        client: The S2GOS client. It is shared by all submissions.
+        request_files: The request files, see
+            [find_request_files()][s2gos_client.batch.find_request_files].
+        state_path: The state file used to resume an interrupted batch.
+        manifest_path: Optional file that receives the
+            [BatchReport][s2gos_client.batch.BatchReport] as JSON.
+        max_workers: Maximum number of concurrent submissions.
+        wait: Whether to wait until all submitted jobs have finished.
+        poll_interval: Seconds between job status updates while waiting.
+        on_entry: Optional function called with each new entry.
+
+    Returns:
+        The batch report.
+    """
+    state_path = Path(state_path)
+    state = _load_state(state_path)
+    lock = threading.Lock()
+
+    pending: list[BatchEntry] = []
+    entries: list[BatchEntry] = []
+    keys: set[str] = set()
+    for request_file in request_files:
+        path = Path(request_file)
+        key = str(path.resolve())
+        if key in keys:
+            # Never submit the same file twice
+            continue
+        keys.add(key)
+        checksum = hashlib.sha256(path.read_bytes()).hexdigest()
+        entry = state.entries.get(key)
+        if entry is None or entry.jobID is None or entry.sha256 != checksum:
+            entry = BatchEntry(requestFile=str(path), sha256=checksum)
+            state.entries[key] = entry
+            pending.append(entry)
+        entries.append(entry)
+
+    def submit(entry: BatchEntry):
+        process_id: Optional[str] = None
+        job_info: Optional[JobInfo] = None
+        error: Optional[str] = None
+        try:
+            request = ExecutionRequest.create(request_path=entry.requestFile)
+            process_id = request.process_id
+            job_info = client.execute_process(
+                process_id=request.process_id, request=request.to_process_request()
+            )
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        # Entries are only changed while holding the lock,
+        # so that the state is never saved while being changed
+        with lock:
+            entry.processID = process_id
+            if job_info is not None:
+                entry.jobID = job_info.jobID
+                entry.status = job_info.status
+            entry.error = error
+            _save_state(state_path, state)
+        if on_entry is not None:
+            on_entry(entry)
+
+    start = time.monotonic()
+    if pending:
+        # The client creates its HTTP session lazily and not thread-safe,
+        # hence submit the first request before sharing the client
+        submit(pending[0])
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="s2gos-batch"
+    )
+    try:
+        # Consume the results to propagate unexpected errors
+        list(executor.map(submit, pending[1:]))
+    finally:
+        executor.shutdown(cancel_futures=True)
+    elapsed = time.monotonic() - start
+
+    if wait:
+        _wait_for_jobs(client, entries, poll_interval)
+        _save_state(state_path, state)
+
+    failed = sum(1 for e in pending if e.jobID is None)
+    submitted = len(pending) - failed
+    report = BatchReport(
+        entries=entries,
+        submitted=submitted,
+        skipped=len(entries) - len(pending),
+        failed=failed,
+        elapsed=elapsed,
+        throughput=submitted / elapsed if elapsed > 0 else 0.0,
+    )
+    if manifest_path is not None:
+        _write_atomically(Path(manifest_path), report.model_dump_json(indent=2))
+    return report
+
+
+def _wait_for_jobs(client: Client, entries: list[BatchEntry], poll_interval: float):
+    while True:
+        running = [
+            e
+            for e in entries
+            if e.jobID is not None and e.status not in _TERMINAL_STATUSES
+        ]
+        if not running:
+            return
+        for entry in running:
+            assert entry.jobID is not None
+            entry.status = client.get_job(entry.jobID).status
+        if any(e.status not in _TERMINAL_STATUSES for e in running):
+            time.sleep(poll_interval)
+
+
+def _load_state(state_path: Path) -> BatchState:
+    if state_path.exists():
+        return BatchState.model_validate_json(state_path.read_text())
+    return BatchState()
+
+
+def _save_state(state_path: Path, state: BatchState):
+    _write_atomically(state_path, state.model_dump_json(indent=2))
+
+
+def _write_atomically(path: Path, text: str):
+    # Never leave a truncated file behind if interrupted
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,318 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Client-side cache of finished jobs.
+
+Once a job has succeeded or failed, its status document and results never
+change. A [JobCache][s2gos_client.cache.JobCache] keeps them in memory and
+on disk, so that they are served without calling the server again, also
+across sessions. The [CachingTransport][s2gos_client.cache.CachingTransport]
+applies it to the job requests of a client. Jobs that have not finished
+yet, and dismissed jobs, which may still be deleted, are always requested
+from the server.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from cuiman.api.transport import AsyncTransport, Transport, TransportArgs
+from gavicore.models import JobInfo, JobList, JobResults, JobStatus
+
+DEFAULT_CACHE_DIR = Path("~").expanduser() / ".s2gos-client-cache"
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+DEFAULT_MAX_MEMORY_SIZE = 16 * 1024 * 1024
+
+# Dismissed jobs are not final, the server may still delete them
+FINISHED_STATUSES = (JobStatus.successful, JobStatus.failed)
+
+JOB_PATH = "/jobs/{jobId}"
+JOB_RESULTS_PATH = "/jobs/{jobId}/results"
+JOBS_PATH = "/jobs"
+EXECUTION_PATH = "/processes/{processID}/execution"
+
+CacheKind = Literal["job", "results"]
+
+
+class JobCache:
+    """
+    A thread-safe, size-bounded LRU cache of the JSON documents of
+    finished jobs, kept in memory and in a directory on disk.
+
+    Documents are cached per API URL and user, so that the jobs of
+    one user are never served to another one. The disk cache may be
+    shared by multiple processes.
+
+    Args:
+        cache_dir: The cache directory. Defaults to `~/.s2gos-client-cache`.
+        max_size: Maximum total size of the cached documents on disk
+            in bytes, defaults to 256 MiB.
+        max_memory_size: Maximum total size of the cached documents in
+            memory in bytes, defaults to 16 MiB.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path | str] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_size = max_size
+        self.max_memory_size = min(max_memory_size, max_size)
+        self.size = 0
+        self.memory_size = 0
+        self._memory: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        # Lazily scanned from cache_dir, ordered from least to most recently used
+        self._files: Optional[OrderedDict[str, int]] = None
+        self._lock = threading.Lock()
+
+    def get(
+        self, api_url: str, kind: CacheKind, job_id: str, user: Optional[str] = None
+    ) -> Any:
+        """Get the cached JSON document, or `None` if it is not cached."""
+        key = _get_key(api_url, kind, job_id, user)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry[0]
+            # Also look for files written by other processes
+            path = self.cache_dir / key
+            try:
+                data = path.read_bytes()
+                json_data = json.loads(data)
+                os.utime(path)
+            except (OSError, ValueError):
+                self._remove_file(key)
+                return None
+            files = self._get_files()
+            if key not in files:
+                files[key] = len(data)
+                self.size += len(data)
+            files.move_to_end(key)
+            self._add_to_memory(key, json_data, len(data))
+            return json_data
+
+    def put(
+        self,
+        api_url: str,
+        kind: CacheKind,
+        job_id: str,
+        json_data: Any,
+        user: Optional[str] = None,
+    ):
+        """Cache the JSON document of a finished job."""
+        key = _get_key(api_url, kind, job_id, user)
+        data = json.dumps(json_data, separators=(",", ":")).encode("utf-8")
+        size = len(data)
+        with self._lock:
+            self._remove_from_memory(key)
+            self._remove_file(key)
+            if size > self.max_size:
+                return
+            self._add_to_memory(key, json_data, size)
+            path = self.cache_dir / key
+            tmp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(data)
+                tmp_path.replace(path)
+            except OSError:
+                # The in-memory cache still works
+                tmp_path.unlink(missing_ok=True)
+                return
+            files = self._get_files()
+            files[key] = size
+            self.size += size
+            while self.size > self.max_size:
+                self._remove_file(next(iter(files)))
+
+    def remove(self, api_url: str, job_id: str, user: Optional[str] = None):
+        """Remove the cached documents of a job, if any."""
+        with self._lock:
+            for kind in ("job", "results"):
+                key = _get_key(api_url, kind, job_id, user)
+                self._remove_from_memory(key)
+                self._remove_file(key)
+
+    def clear(self):
+        """Remove all cached documents, also from disk."""
+        with self._lock:
+            self._memory.clear()
+            self.memory_size = 0
+            for key in list(self._get_files()):
+                self._remove_file(key)
+
+    def _get_files(self) -> OrderedDict[str, int]:
+        if self._files is None:
+            entries = []
+            if self.cache_dir.is_dir():
+                for path in self.cache_dir.glob("*.json"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, path.name, stat.st_size))
+            entries.sort()
+            self._files = OrderedDict((name, size) for _, name, size in entries)
+            self.size = sum(self._files.values())
+        return self._files
+
+    def _remove_file(self, key: str):
+        size = self._get_files().pop(key, None)
+        if size is not None:
+            self.size -= size
+            (self.cache_dir / key).unlink(missing_ok=True)
+
+    def _add_to_memory(self, key: str, json_data: Any, size: int):
+        if size > self.max_memory_size:
+            return
+        self._memory[key] = json_data, size
+        self.memory_size += size
+        while self.memory_size > self.max_memory_size:
+            _key, (_json_data, evicted_size) = self._memory.popitem(last=False)
+            self.memory_size -= evicted_size
+
+    def _remove_from_memory(self, key: str):
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self.memory_size -= entry[1]
+
+
+class CachingTransport(Transport, AsyncTransport):
+    """
+    A transport that serves the status documents and results of finished
+    jobs from a [JobCache][s2gos_client.cache.JobCache] and passes all
+    other calls on to the wrapped transport.
+
+    Cached jobs that the server lists as unfinished, or returns as newly
+    created, e.g., because it reuses job identifiers after a restart,
+    are removed from the cache, as are jobs the server returns with a
+    different creation time than the cached one. Results are only served
+    while the status document of their job is cached.
+
+    Args:
+        transport: The wrapped transport.
+        cache: The job cache.
+        api_url: The URL of the API the cached jobs belong to.
+        user: The identity of the user the cached jobs belong to, e.g.,
+            the username, or `None` if the API requires no authentication.
+    """
+
+    def __init__(
+        self,
+        transport: Any,
+        cache: JobCache,
+        api_url: str,
+        user: Optional[str] = None,
+    ):
+        self.transport = transport
+        self.cache = cache
+        self.api_url = api_url
+        self.user = user
+        self.return_type_map: dict[type, type] = getattr(
+            transport, "return_type_map", {}
+        )
+
+    def call(self, args: TransportArgs) -> Any:
+        kind = self._get_cache_kind(args)
+        if kind is not None:
+            json_data = self._get(kind, args.path_params["jobId"])
+            if json_data is not None:
+                return args.get_response_for_status(
+                    200, json_data, self.return_type_map
+                )
+        response = self.transport.call(args)
+        self._update_cache(args, kind, response)
+        return response
+
+    async def async_call(self, args: TransportArgs) -> Any:
+        kind = self._get_cache_kind(args)
+        if kind is not None:
+            # Don't block the event loop by disk I/O
+            json_data = await asyncio.to_thread(
+                self._get, kind, args.path_params["jobId"]
+            )
+            if json_data is not None:
+                return args.get_response_for_status(
+                    200, json_data, self.return_type_map
+                )
+        response = await self.transport.async_call(args)
+        await asyncio.to_thread(self._update_cache, args, kind, response)
+        return response
+
+    def close(self):
+        self.transport.close()
+
+    async def async_close(self):
+        await self.transport.async_close()
+
+    @staticmethod
+    def _get_cache_kind(args: TransportArgs) -> Optional[CacheKind]:
+        if args.method != "get":
+            return None
+        if args.path == JOB_PATH:
+            return "job"
+        if args.path == JOB_RESULTS_PATH:
+            return "results"
+        return None
+
+    def _get(self, kind: CacheKind, job_id: str) -> Any:
+        if (
+            kind == "results"
+            and self.cache.get(self.api_url, "job", job_id, user=self.user) is None
+        ):
+            # The job may have been replaced, e.g., by one with the same ID
+            return None
+        return self.cache.get(self.api_url, kind, job_id, user=self.user)
+
+    def _update_cache(
+        self, args: TransportArgs, kind: Optional[CacheKind], response: Any
+    ):
+        if kind == "results" and isinstance(response, JobResults):
+            # Results are only available for successful jobs
+            self.cache.put(
+                self.api_url,
+                kind,
+                args.path_params["jobId"],
+                _to_json(response),
+                user=self.user,
+            )
+        elif kind == "job" and isinstance(response, JobInfo):
+            self._put_job_info(response)
+        elif args.method == "delete" and args.path == JOB_PATH:
+            self.cache.remove(self.api_url, args.path_params["jobId"], user=self.user)
+        elif args.path == EXECUTION_PATH and isinstance(response, JobInfo):
+            self.cache.remove(self.api_url, response.jobID, user=self.user)
+        elif args.path == JOBS_PATH and isinstance(response, JobList):
+            for job_info in response.jobs:
+                self._put_job_info(job_info)
+
+    def _put_job_info(self, job_info: JobInfo):
+        if job_info.status not in FINISHED_STATUSES:
+            self.cache.remove(self.api_url, job_info.jobID, user=self.user)
+            return
+        json_data = _to_json(job_info)
+        cached = self.cache.get(self.api_url, "job", job_info.jobID, user=self.user)
+        if cached is None or cached.get("created") != json_data.get("created"):
+            # Cached results may belong to another job with the same ID
+            self.cache.remove(self.api_url, job_info.jobID, user=self.user)
+        self.cache.put(self.api_url, "job", job_info.jobID, json_data, user=self.user)
+
+
+def _to_json(response: Any) -> Any:
+    return response.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+
+def _get_key(api_url: str, kind: CacheKind, job_id: str, user: Optional[str]) -> str:
+    # Also hides the user, which may be a credential, such as a token
+    scope = f"{api_url}\n{user or ''}\n{job_id}"
+    digest = hashlib.sha256(scope.encode("utf-8")).hexdigest()
+    return f"{digest[:32]}-{kind}.json"
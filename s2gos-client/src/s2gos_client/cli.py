@@ -3,10 +3,13 @@
 #  https://opensource.org/license/apache-2-0.
 
 from importlib import import_module
+from typing import Annotated, Optional
 
+import typer
 from cuiman.cli import new_cli
 
 from s2gos_client import __version__ as version
+from s2gos_client.batch import DEFAULT_MAX_WORKERS, DEFAULT_STATE_PATH
 
 # Setup S2GOS-specific API configuration
 import_module("s2gos_client.api")
@@ -17,6 +20,139 @@ cli = new_cli(
     summary="Interact with the ESA DTE S2GOS processing service.",
 )
 
+
+@cli.command()
+def logs(
+    ctx: typer.Context,
+    job_id: Annotated[str, typer.Argument(help="Job identifier.")],
+    follow: Annotated[
+        bool,
+        typer.Option(
+            "--follow",
+            "-F",
+            help="Keep streaming new output until the job has finished.",
+        ),
+    ] = False,
+    offset: Annotated[
+        int,
+        typer.Option("--offset", help="Byte offset to start reading from."),
+    ] = 0,
+    config_file: Annotated[
+        Optional[str],
+        typer.Option(
+            "--config", "-c", help="Client configuration file.", metavar="PATH"
+        ),
+    ] = None,
+):
+    """Show the output of a job."""
+    from cuiman.cli.client import use_client
+
+    from s2gos_client.logs import follow_job_logs
+
+    with use_client(ctx, config_file) as client:
+        try:
+            for text in follow_job_logs(client, job_id, offset=offset, follow=follow):
+                typer.echo(text, nl=False)
+        except KeyboardInterrupt:
+            pass
+
+
+batch_cli = typer.Typer(
+    name="batch",
+    help="Submit many execution requests at once.",
+    no_args_is_help=True,
+)
+cli.add_typer(batch_cli)
+
+
+@batch_cli.command("run")
+def batch_run(
+    ctx: typer.Context,
+    sources: Annotated[
+        list[str],
+        typer.Argument(
+            help="Request files, directories of request files, or glob patterns.",
+        ),
+    ],
+    state_file: Annotated[
+        str,
+        typer.Option(
+            "--state",
+            help="State file used to resume an interrupted batch.",
+            metavar="PATH",
+        ),
+    ] = DEFAULT_STATE_PATH,
+    manifest_file: Annotated[
+        Optional[str],
+        typer.Option(
+            "--manifest",
+            "-o",
+            help="File that receives the results manifest as JSON.",
+            metavar="PATH",
+        ),
+    ] = None,
+    parallel: Annotated[
+        int,
+        typer.Option(
+            "--parallel", "-p", min=1, help="Maximum number of concurrent submissions."
+        ),
+    ] = DEFAULT_MAX_WORKERS,
+    wait: Annotated[
+        bool,
+        typer.Option("--wait", help="Wait until all submitted jobs have finished."),
+    ] = False,
+    config_file: Annotated[
+        Optional[str],
+        typer.Option(
+            "--config", "-c", help="Client configuration file.", metavar="PATH"
+        ),
+    ] = None,
+):
+    """
+    Submit execution request files concurrently.
+
+    Request files that have already been submitted by an earlier run with
+    the same state file, and have not changed since, are skipped.
+    """
+    from cuiman.cli.client import use_client
+
+    from s2gos_client.batch import BatchEntry, find_request_files, run_batch
+
+    try:
+        request_files = find_request_files(sources)
+    except FileNotFoundError as e:
+        raise typer.BadParameter(str(e), param_hint="SOURCES") from e
+
+    def on_entry(entry: BatchEntry):
+        if entry.error is not None:
+            typer.echo(f"{entry.requestFile}: {entry.error}", err=True)
+        else:
+            typer.echo(f"{entry.requestFile}: {entry.jobID}")
+
+    with use_client(ctx, config_file) as client:
+        report = run_batch(
+            client,
+            request_files,
+            state_path=state_file,
+            manifest_path=manifest_file,
+            max_workers=parallel,
+            wait=wait,
+            on_entry=on_entry,
+        )
+
+    if wait:
+        for entry in report.entries:
+            if entry.status is not None:
+                typer.echo(f"{entry.requestFile}: {entry.jobID} {entry.status.value}")
+    typer.echo(
+        f"Submitted {report.submitted} request(s) in {report.elapsed:.1f}s"
+        f" ({report.throughput:.1f}/s), skipped {report.skipped},"
+        f" failed {report.failed}"
+    )
+    if report.failed:
+        raise typer.Exit(code=1)
+
+
 __all__ = [
     "cli",
 ]
@@ -0,0 +1,104 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from typing import Any, Optional, cast
+
+from cuiman.api import AsyncClient, Client
+from cuiman.api.transport import AsyncTransport, Transport, TransportArgs
+from gavicore.models import ApiError, ProcessRequest
+from pydantic import BaseModel, Field
+
+
+class CostEstimate(BaseModel):
+    """The predicted cost of executing a process request."""
+
+    processID: str = Field(description="Process identifier")
+    runtime: Optional[float] = Field(
+        default=None, description="Predicted runtime in seconds, if known"
+    )
+    stages: dict[str, float] = Field(
+        default_factory=dict, description="Predicted runtime in seconds per stage"
+    )
+    outputSize: Optional[int] = Field(
+        default=None, description="Predicted size of the outputs in bytes, if known"
+    )
+    sampleCount: int = Field(
+        description="Number of recorded jobs the prediction is based on"
+    )
+
+
+def estimate_process(
+    client: Client,
+    process_id: str,
+    request: ProcessRequest,
+    **kwargs: Any,
+) -> CostEstimate:
+    """Estimate the cost of executing a process without executing it.
+
+    The S2GOS server predicts the runtime and output size from the
+    recorded costs of past jobs of the same process. Use it to reject
+    or defer expensive requests before submitting them.
+
+    Args:
+        client: The S2GOS client.
+        process_id: The process identifier.
+        request: The process request, as it would be passed to
+            `client.execute_process()`.
+        kwargs: Extra keyword arguments passed to the HTTP request.
+
+    Returns:
+        The cost estimate. Its `runtime` and `outputSize` are `None`
+        if no job of the process has been recorded yet.
+
+    Raises:
+        ClientError: If the call to the web service fails
+            with a status code != `2xx`.
+    """
+    # noinspection PyProtectedMember
+    transport = cast(Transport, client._transport)
+    return transport.call(_get_estimate_args(process_id, request, kwargs))
+
+
+async def async_estimate_process(
+    client: AsyncClient,
+    process_id: str,
+    request: ProcessRequest,
+    **kwargs: Any,
+) -> CostEstimate:
+    """Estimate the cost of executing a process without executing it.
+
+    Like [estimate_process()][s2gos_client.estimates.estimate_process],
+    but for the asynchronous client.
+
+    Args:
+        client: The asynchronous S2GOS client.
+        process_id: The process identifier.
+        request: The process request, as it would be passed to
+            `client.execute_process()`.
+        kwargs: Extra keyword arguments passed to the HTTP request.
+
+    Returns:
+        The cost estimate.
+
+    Raises:
+        ClientError: If the call to the web service fails
+            with a status code != `2xx`.
+    """
+    # noinspection PyProtectedMember
+    transport = cast(AsyncTransport, client._transport)
+    return await transport.async_call(_get_estimate_args(process_id, request, kwargs))
+
+
+def _get_estimate_args(
+    process_id: str, request: ProcessRequest, kwargs: dict[str, Any]
+) -> TransportArgs:
+    return TransportArgs(
+        path="/processes/{processID}/estimate",
+        method="post",
+        path_params={"processID": process_id},
+        request=request,
+        return_types={"200": CostEstimate},
+        error_types={"400": ApiError, "404": ApiError, "500": ApiError},
+        extra_kwargs=kwargs,
+    )
@@ -0,0 +1,103 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from collections.abc import Iterator
+from typing import Any, cast
+
+from cuiman.api import Client
+from cuiman.api.transport import Transport, TransportArgs
+from gavicore.models import ApiError
+from pydantic import BaseModel, Field
+
+DEFAULT_WAIT = 10.0
+"""Default seconds the server waits for new output when following a log."""
+
+
+class JobLogChunk(BaseModel):
+    """A chunk of a job's log as returned by the S2GOS server."""
+
+    jobID: str = Field(description="Job identifier")
+    offset: int = Field(description="Byte offset of the first byte of `text`")
+    nextOffset: int = Field(description="Byte offset to continue reading from")
+    text: str = Field(description="Log text")
+    finished: bool = Field(
+        description="Whether the job has finished and `nextOffset` is the log's end"
+    )
+
+
+def get_job_logs(
+    client: Client,
+    job_id: str,
+    offset: int = 0,
+    wait: float = 0.0,
+    **kwargs: Any,
+) -> JobLogChunk:
+    """Get the output of a job starting at the given byte offset.
+
+    Args:
+        client: The S2GOS client.
+        job_id: The job identifier.
+        offset: The byte offset to start reading from. Pass the
+            `nextOffset` of a previous chunk to read new output only.
+        wait: Seconds the server waits for new output, if there is none yet.
+        kwargs: Extra keyword arguments passed to the HTTP request.
+
+    Returns:
+        The log chunk.
+
+    Raises:
+        ClientError: If the call to the web service fails
+            with a status code != `2xx`.
+    """
+    query_params: dict[str, Any] = {"offset": offset}
+    if wait > 0:
+        query_params["wait"] = wait
+        # Let the request outlive the server-side wait
+        kwargs.setdefault("timeout", wait + 10.0)
+    # noinspection PyProtectedMember
+    transport = cast(Transport, client._transport)
+    return transport.call(
+        TransportArgs(
+            path="/jobs/{jobId}/logs",
+            method="get",
+            path_params={"jobId": job_id},
+            query_params=query_params,
+            return_types={"200": JobLogChunk},
+            error_types={"404": ApiError, "500": ApiError},
+            extra_kwargs=kwargs,
+        )
+    )
+
+
+def follow_job_logs(
+    client: Client,
+    job_id: str,
+    offset: int = 0,
+    follow: bool = True,
+    wait: float = DEFAULT_WAIT,
+) -> Iterator[str]:
+    """Iterate over the output of a job as it is written.
+
+    Each request only fetches output not yet received. While following,
+    the server holds a request open until new output arrives, so new
+    lines are yielded with low latency and without polling.
+
+    Args:
+        client: The S2GOS client.
+        job_id: The job identifier.
+        offset: The byte offset to start reading from.
+        follow: Whether to keep reading until the job has finished.
+            If `False`, only the currently available output is yielded.
+        wait: Seconds the server waits for new output per request.
+
+    Returns:
+        An iterator of log texts.
+    """
+    while True:
+        chunk = get_job_logs(client, job_id, offset=offset, wait=wait if follow else 0)
+        if chunk.text:
+            yield chunk.text
+        offset = chunk.nextOffset
+        if chunk.finished or (not follow and not chunk.text):
+            return
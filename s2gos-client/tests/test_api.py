@@ -2,7 +2,7 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import s2gos_client.api
 from cuiman.api.auth import LoginResult
@@ -30,7 +30,9 @@ def test_create_client():
         client = s2gos_client.api.create_client(api_url="https://example.test")
 
     create_config.assert_called_once_with(api_url="https://example.test")
-    client_type.assert_called_once_with(config=config, _debug=False)
+    client_type.assert_called_once_with(config=config, _debug=False, _transport=ANY)
+    transport = client_type.call_args.kwargs["_transport"]
+    assert isinstance(transport, s2gos_client.api.CachingTransport)
     assert client is client_type.return_value
 
 
@@ -46,10 +48,34 @@ def test_create_async_client():
         client = s2gos_client.api.create_async_client(api_url="https://example.test")
 
     create_config.assert_called_once_with(api_url="https://example.test")
-    client_type.assert_called_once_with(config=config, _debug=False)
+    client_type.assert_called_once_with(config=config, _debug=False, _transport=ANY)
+    transport = client_type.call_args.kwargs["_transport"]
+    assert isinstance(transport, s2gos_client.api.CachingTransport)
     assert client is client_type.return_value
 
 
+def test_create_client_without_job_cache():
+    config = s2gos_client.api.S2GOSConfig(
+        api_url="https://example.test", auth_type="none", cache_size=0
+    )
+
+    with (
+        patch.object(s2gos_client.api.ClientConfig, "create", return_value=config),
+        patch.object(s2gos_client.api, "Client") as client_type,
+    ):
+        s2gos_client.api.create_client()
+
+    client_type.assert_called_once_with(config=config, _debug=False, _transport=None)
+
+
+def test_job_cache_user():
+    get_user = s2gos_client.api._get_user
+    assert get_user(Mock(auth_type="none")) is None
+    assert get_user(Mock(auth_type="login", username="bibo")) == "login:bibo"
+    assert get_user(Mock(auth_type="token", token="t1")) == "token:t1"
+    assert get_user(Mock(auth_type="api-key", api_key="k1")) == "api-key:k1"
+
+
 def test_create_config_logs_in_and_retains_refresh_token():
     config = Mock(auth_type="login", token=None)
     login_result = LoginResult(
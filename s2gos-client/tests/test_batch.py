@@ -0,0 +1,161 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from gavicore.models import JobInfo, JobStatus
+from typer.testing import CliRunner
+
+from s2gos_client.batch import BatchReport, find_request_files, run_batch
+from s2gos_client.cli import cli
+
+
+def write_requests(directory: Path, count: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = directory / f"request_{i}.json"
+        path.write_text(
+            json.dumps({"process_id": "primes_between", "inputs": {"max_val": i}})
+        )
+        paths.append(path)
+    return paths
+
+
+def new_client(fail_for: int | None = None) -> Mock:
+    lock = threading.Lock()
+    count = 0
+
+    def execute_process(process_id, request):
+        nonlocal count
+        if request.inputs["max_val"] == fail_for:
+            raise ValueError("boom")
+        with lock:
+            count += 1
+            job_id = f"job_{count}"
+        return JobInfo(
+            jobID=job_id,
+            processID=process_id,
+            status=JobStatus.accepted,
+        )
+
+    client = Mock()
+    client.execute_process.side_effect = execute_process
+    return client
+
+
+def test_find_request_files(tmp_path):
+    paths = write_requests(tmp_path, 3)
+    (tmp_path / "notes.txt").write_text("")
+
+    assert find_request_files([tmp_path]) == paths
+    assert find_request_files([str(tmp_path / "*_1.json"), paths[1]]) == [paths[1]]
+    with pytest.raises(FileNotFoundError):
+        find_request_files([str(tmp_path / "*.yaml")])
+
+
+def test_find_request_files_dedupes_resolved_paths(tmp_path, monkeypatch):
+    paths = write_requests(tmp_path, 2)
+    monkeypatch.chdir(tmp_path)
+
+    assert find_request_files([paths[0], "request_0.json", ".", tmp_path]) == [
+        paths[0],
+        Path("request_1.json"),
+    ]
+
+
+def test_run_batch_submits_each_file_once(tmp_path, monkeypatch):
+    paths = write_requests(tmp_path, 2)
+    monkeypatch.chdir(tmp_path)
+    client = new_client()
+
+    report = run_batch(
+        client,
+        [paths[0], "request_0.json", paths[1], "./request_1.json"],
+        state_path=tmp_path / "state.json",
+    )
+
+    assert (report.submitted, report.skipped, report.failed) == (2, 0, 0)
+    assert client.execute_process.call_count == 2
+    assert [e.requestFile for e in report.entries] == [str(p) for p in paths]
+
+
+def test_run_batch_submits_first_request_before_sharing_client(tmp_path):
+    client = new_client()
+    execute_process = client.execute_process.side_effect
+    thread_names = []
+
+    def record_thread(process_id, request):
+        thread_names.append(threading.current_thread().name)
+        return execute_process(process_id, request)
+
+    client.execute_process.side_effect = record_thread
+    run_batch(client, write_requests(tmp_path, 4), state_path=tmp_path / "state.json")
+
+    assert len(thread_names) == 4
+    assert thread_names[0] == threading.current_thread().name
+    assert all(name.startswith("s2gos-batch") for name in thread_names[1:])
+
+
+def test_run_batch_resumes_without_resubmitting(tmp_path):
+    paths = write_requests(tmp_path, 5)
+    state_path = tmp_path / "state.json"
+    manifest_path = tmp_path / "results.json"
+
+    client = new_client(fail_for=3)
+    report = run_batch(client, paths, state_path=state_path, max_workers=3)
+    assert (report.submitted, report.skipped, report.failed) == (4, 0, 1)
+    assert report.entries[3].error == "boom"
+    assert report.entries[0].processID == "primes_between"
+
+    # Change one submitted file, the failed one is retried
+    paths[0].write_text(
+        json.dumps({"process_id": "primes_between", "inputs": {"max_val": 100}})
+    )
+    client = new_client()
+    report = run_batch(
+        client, paths, state_path=state_path, manifest_path=manifest_path
+    )
+    assert (report.submitted, report.skipped, report.failed) == (2, 3, 0)
+    assert client.execute_process.call_count == 2
+    assert all(e.jobID for e in report.entries)
+
+    manifest = BatchReport.model_validate_json(manifest_path.read_text())
+    assert manifest == report
+
+
+def test_run_batch_wait(tmp_path):
+    paths = write_requests(tmp_path, 2)
+    client = new_client()
+    client.get_job.side_effect = lambda job_id: JobInfo(
+        jobID=job_id, status=JobStatus.successful
+    )
+
+    report = run_batch(
+        client, paths, state_path=tmp_path / "state.json", wait=True, poll_interval=0
+    )
+
+    assert [e.status for e in report.entries] == [JobStatus.successful] * 2
+    assert client.get_job.call_count == 2
+
+
+def test_cli_batch_run(tmp_path):
+    write_requests(tmp_path, 2)
+    client = new_client()
+    state_path = tmp_path / "state.json"
+
+    result = CliRunner().invoke(
+        cli,
+        ["batch", "run", str(tmp_path), "--state", str(state_path)],
+        obj={"get_client": lambda _: client},
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Submitted 2 request(s)" in result.output
+    assert "skipped 0, failed 0" in result.output
+    assert state_path.exists()
+    client.close.assert_called_once()
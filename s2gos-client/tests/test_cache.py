@@ -0,0 +1,140 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, Mock
+
+from cuiman.api import AsyncClient, Client
+from gavicore.models import JobInfo, JobList, JobResults, JobStatus
+
+from s2gos_client.cache import CachingTransport, JobCache
+
+API_URL = "https://example.test/"
+
+
+def new_job_info(job_id: str, status: JobStatus) -> JobInfo:
+    return JobInfo(jobID=job_id, processID="p", type="process", status=status)
+
+
+def new_client(tmp_path, *responses, client_type: type = Client) -> tuple[Client, Mock]:
+    transport = AsyncMock() if client_type is AsyncClient else Mock()
+    transport.return_type_map = {}
+    transport.call.side_effect = responses
+    transport.async_call.side_effect = responses
+    client = client_type(
+        api_url=API_URL,
+        _transport=CachingTransport(
+            transport, JobCache(cache_dir=tmp_path), api_url=API_URL
+        ),
+    )
+    return client, transport
+
+
+def test_job_cache_is_size_bounded_lru(tmp_path):
+    cache = JobCache(cache_dir=tmp_path, max_size=150, max_memory_size=100)
+    for job_id in ("a", "b", "c"):
+        cache.put(API_URL, "job", job_id, {"jobID": job_id, "data": "x" * 40})
+    assert cache.size <= 150
+    assert cache.memory_size <= 100
+    assert cache.get(API_URL, "job", "a") is None
+    assert cache.get(API_URL, "job", "b") == {"jobID": "b", "data": "x" * 40}
+
+    # Other caches, e.g., of later sessions, read from disk
+    cache_2 = JobCache(cache_dir=tmp_path, max_size=150)
+    assert cache_2.get(API_URL, "job", "c") == {"jobID": "c", "data": "x" * 40}
+    assert cache_2.get("https://other.test/", "job", "c") is None
+
+    cache_2.remove(API_URL, "c")
+    assert cache_2.get(API_URL, "job", "c") is None
+    cache_2.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_job_cache_separates_users(tmp_path):
+    cache = JobCache(cache_dir=tmp_path)
+    cache.put(API_URL, "job", "job_0", {"jobID": "job_0"}, user="login:alice")
+
+    assert cache.get(API_URL, "job", "job_0", user="login:alice") == {"jobID": "job_0"}
+    assert cache.get(API_URL, "job", "job_0", user="login:bob") is None
+    assert cache.get(API_URL, "job", "job_0") is None
+    assert not any("alice" in path.name for path in tmp_path.iterdir())
+
+
+def test_finished_jobs_are_served_from_cache(tmp_path):
+    running = new_job_info("job_0", JobStatus.running)
+    successful = new_job_info("job_0", JobStatus.successful)
+    results = JobResults({"return_value": 42})
+    client, transport = new_client(tmp_path, running, successful, results)
+
+    assert client.get_job("job_0") == running
+    assert client.get_job("job_0") == successful
+    assert client.get_job("job_0") == successful
+    assert client.get_job_results("job_0") == results
+    assert client.get_job_results("job_0") == results
+    assert transport.call.call_count == 3
+
+
+def test_unfinished_jobs_are_removed_from_cache(tmp_path):
+    successful = new_job_info("job_0", JobStatus.successful)
+    job_list = JobList(jobs=[new_job_info("job_0", JobStatus.accepted)], links=[])
+    client, transport = new_client(tmp_path, successful, job_list, successful)
+
+    client.get_job("job_0")
+    client.get_jobs()
+    client.get_job("job_0")
+    assert transport.call.call_count == 3
+
+
+def test_async_client_uses_cache(tmp_path):
+    failed = new_job_info("job_1", JobStatus.failed)
+    client, transport = new_client(tmp_path, failed, client_type=AsyncClient)
+
+    async def get_job_twice():
+        return [await client.get_job("job_1") for _ in range(2)]
+
+    assert asyncio.run(get_job_twice()) == [failed, failed]
+    assert transport.async_call.call_count == 1
+
+
+def test_dismissed_jobs_are_not_cached(tmp_path):
+    dismissed = new_job_info("job_0", JobStatus.dismissed)
+    client, transport = new_client(tmp_path, dismissed, dismissed)
+
+    client.get_job("job_0")
+    client.get_job("job_0")
+    assert transport.call.call_count == 2
+
+
+def test_jobs_with_reused_ids_replace_cached_jobs(tmp_path):
+    old_job = new_job_info("job_0", JobStatus.successful)
+    old_job.created = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+    new_job = new_job_info("job_0", JobStatus.successful)
+    new_job.created = datetime.datetime(2026, 2, 1, tzinfo=datetime.UTC)
+    new_results = JobResults({"return_value": 2})
+    client, transport = new_client(
+        tmp_path,
+        old_job,
+        JobResults({"return_value": 1}),
+        JobList(jobs=[new_job], links=[]),
+        new_results,
+    )
+    client.get_job("job_0")
+    client.get_job_results("job_0")
+
+    # E.g., the server restarted and reused the job ID
+    client.get_jobs()
+
+    assert client.get_job("job_0") == new_job
+    assert client.get_job_results("job_0") == new_results
+    assert transport.call.call_count == 4
+
+
+def test_results_are_served_with_their_job_only(tmp_path):
+    results = JobResults({"return_value": 42})
+    client, transport = new_client(tmp_path, results, results)
+
+    client.get_job_results("job_0")
+    client.get_job_results("job_0")
+    assert transport.call.call_count == 2
@@ -0,0 +1,55 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from gavicore.models import ProcessRequest
+
+from s2gos_client.estimates import (
+    CostEstimate,
+    async_estimate_process,
+    estimate_process,
+)
+
+
+def test_estimate_process():
+    estimate = CostEstimate(
+        processID="mtr_demo_simulation",
+        runtime=120.0,
+        stages={"simulation": 118.0},
+        sampleCount=12,
+    )
+    client = Mock()
+    client._transport.call.return_value = estimate
+    request = ProcessRequest(inputs={"spp": 64, "observation": "chime"})
+
+    assert estimate_process(client, "mtr_demo_simulation", request) is estimate
+    args = client._transport.call.call_args.args[0]
+    assert args.path == "/processes/{processID}/estimate"
+    assert args.method == "post"
+    assert args.path_params == {"processID": "mtr_demo_simulation"}
+    assert args.request is request
+    assert args.return_types == {"200": CostEstimate}
+
+
+def test_async_estimate_process():
+    estimate = CostEstimate(processID="mtr_demo_simulation", sampleCount=0)
+    client = Mock()
+    client._transport.async_call = AsyncMock(return_value=estimate)
+    request = ProcessRequest(inputs={"spp": 64})
+
+    result = asyncio.run(
+        async_estimate_process(client, "mtr_demo_simulation", request, timeout=5)
+    )
+
+    assert result is estimate
+    assert estimate.runtime is None
+    assert estimate.outputSize is None
+    args = client._transport.async_call.call_args.args[0]
+    assert args.path == "/processes/{processID}/estimate"
+    assert args.method == "post"
+    assert args.path_params == {"processID": "mtr_demo_simulation"}
+    assert args.request is request
+    assert args.extra_kwargs == {"timeout": 5}
@@ -0,0 +1,77 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+from unittest.mock import Mock
+
+from typer.testing import CliRunner
+
+from s2gos_client.cli import cli
+from s2gos_client.logs import JobLogChunk, follow_job_logs, get_job_logs
+
+
+def new_chunk(offset: int, text: str, finished: bool = False) -> JobLogChunk:
+    return JobLogChunk(
+        jobID="job_1",
+        offset=offset,
+        nextOffset=offset + len(text),
+        text=text,
+        finished=finished,
+    )
+
+
+def new_client(*chunks: JobLogChunk) -> Mock:
+    client = Mock()
+    client._transport.call.side_effect = list(chunks)
+    return client
+
+
+def test_get_job_logs():
+    client = new_client(new_chunk(7, "line 2\n"))
+
+    chunk = get_job_logs(client, "job_1", offset=7, wait=2.0)
+
+    assert chunk.text == "line 2\n"
+    args = client._transport.call.call_args.args[0]
+    assert args.path == "/jobs/{jobId}/logs"
+    assert args.path_params == {"jobId": "job_1"}
+    assert args.query_params == {"offset": 7, "wait": 2.0}
+    assert args.extra_kwargs == {"timeout": 12.0}
+
+
+def test_follow_job_logs_reads_incrementally_until_finished():
+    client = new_client(
+        new_chunk(0, "line 1\n"),
+        new_chunk(7, ""),
+        new_chunk(7, "line 2\n", finished=True),
+    )
+
+    assert list(follow_job_logs(client, "job_1")) == ["line 1\n", "line 2\n"]
+    offsets = [
+        call.args[0].query_params["offset"]
+        for call in client._transport.call.call_args_list
+    ]
+    assert offsets == [0, 7, 7]
+
+
+def test_follow_job_logs_without_follow():
+    client = new_client(new_chunk(0, "line 1\n"), new_chunk(7, ""))
+
+    assert list(follow_job_logs(client, "job_1", follow=False)) == ["line 1\n"]
+    args = client._transport.call.call_args.args[0]
+    assert "wait" not in args.query_params
+
+
+def test_cli_logs_follow():
+    client = new_client(
+        new_chunk(0, "line 1\n"),
+        new_chunk(7, "line 2\n", finished=True),
+    )
+
+    result = CliRunner().invoke(
+        cli, ["logs", "--follow", "job_1"], obj={"get_client": lambda _: client}
+    )
+
+    assert result.exit_code == 0, result.output
+    assert result.output == "line 1\nline 2\n"
+    client.close.assert_called_once()
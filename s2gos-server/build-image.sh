@@ -11,11 +11,16 @@
 #   ./s2gos-server/build-image.sh -t 0.1.0 --push    # build and push to the registry
 #
 #   # Build against a specific eozilla version:
-#   ./s2gos-server/build-image.sh --eozilla-version 0.2.0.dev1
+#   ./s2gos-server/build-image.sh --eozilla-version 0.2.1.dev1
 #
 #   # Override a single package spec (e.g. use the newest proper release):
 #   ./s2gos-server/build-image.sh --wraptile wraptile --stable
 #
+#   # Build a trimmed image without the Airflow client, serving a local service,
+#   # which defaults to s2gos_server.services.testing:service:
+#   ./s2gos-server/build-image.sh -t dev-local --no-airflow \
+#     --service s2gos_server.services.synthetic:service
+#
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -23,11 +28,13 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 IMAGE_REPO="${IMAGE_REPO:-quay.io/s2gos/s2gos-server}"
 IMAGE_TAG=""
 PUSH=0
-EOZILLA_VERSION="0.2.0.dev1"
+EOZILLA_VERSION="0.2.1.dev1"
 GAVICORE_SPEC=""
 PROCODILE_SPEC=""
 WRAPTILE_SPEC=""
 PRE_FLAG="--pre"
+WITH_AIRFLOW="true"
+SERVICE=""
 
 while [[ $# -gt 0 ]]; do
   case "$1" in
@@ -39,12 +46,23 @@ while [[ $# -gt 0 ]]; do
     --wraptile)        WRAPTILE_SPEC="$2"; shift 2 ;;
     --pre)             PRE_FLAG="--pre"; shift ;;
     --stable|--no-pre) PRE_FLAG=""; shift ;;
+    --no-airflow)      WITH_AIRFLOW="false"; shift ;;
+    --service)         SERVICE="$2"; shift 2 ;;
     --push)            PUSH=1; shift ;;
-    -h|--help)         sed -n '2,21p' "${BASH_SOURCE[0]}"; exit 0 ;;
+    -h|--help)         sed -n '2,23p' "${BASH_SOURCE[0]}"; exit 0 ;;
     *)                 echo "unknown argument: $1" >&2; exit 1 ;;
   esac
 done
 
+# Without the Airflow client, the Airflow service cannot be served.
+if [[ "$WITH_AIRFLOW" == "false" ]]; then
+  SERVICE="${SERVICE:-s2gos_server.services.testing:service}"
+  if [[ "$SERVICE" == s2gos_server.services.airflow:* ]]; then
+    echo "--no-airflow cannot be combined with --service ${SERVICE}" >&2
+    exit 1
+  fi
+fi
+
 # Default each unset package spec to the pinned eozilla version.
 GAVICORE_SPEC="${GAVICORE_SPEC:-gavicore==${EOZILLA_VERSION}}"
 PROCODILE_SPEC="${PROCODILE_SPEC:-procodile==${EOZILLA_VERSION}}"
@@ -58,12 +76,20 @@ fi
 IMAGE="${IMAGE_REPO}:${IMAGE_TAG}"
 echo "Building ${IMAGE} (context: ${SCRIPT_DIR}, eozilla: ${EOZILLA_VERSION})"
 
-docker build \
+BUILD_ARGS=(
+  --build-arg "GAVICORE_SPEC=${GAVICORE_SPEC}"
+  --build-arg "PROCODILE_SPEC=${PROCODILE_SPEC}"
+  --build-arg "WRAPTILE_SPEC=${WRAPTILE_SPEC}"
+  --build-arg "PRE_FLAG=${PRE_FLAG}"
+  --build-arg "WITH_AIRFLOW=${WITH_AIRFLOW}"
+)
+if [[ -n "$SERVICE" ]]; then
+  BUILD_ARGS+=(--build-arg "EOZILLA_SERVICE=${SERVICE}")
+fi
+
+DOCKER_BUILDKIT=1 docker build \
   -f "$SCRIPT_DIR/Dockerfile" \
-  --build-arg "GAVICORE_SPEC=${GAVICORE_SPEC}" \
-  --build-arg "PROCODILE_SPEC=${PROCODILE_SPEC}" \
-  --build-arg "WRAPTILE_SPEC=${WRAPTILE_SPEC}" \
-  --build-arg "PRE_FLAG=${PRE_FLAG}" \
+  "${BUILD_ARGS[@]}" \
   -t "$IMAGE" \
   "$SCRIPT_DIR"
 
@@ -2,9 +2,17 @@
 #  Permissions are hereby granted under the terms of the Apache 2.0 License:
 #  https://opensource.org/license/apache-2-0.
 
+from wraptile.app import app
 from wraptile.cli import new_cli
 
 from s2gos_server import __version__ as version
+from s2gos_server.lifecycle import install_lifecycle
+from s2gos_server.routes import include_s2gos_routes
+
+# Set up the app before the server starts, so that the health
+# endpoints and graceful shutdown work before the service is used
+include_s2gos_routes(app)
+install_lifecycle(app)
 
 cli = new_cli(name="s2gos-server", version=version)
 
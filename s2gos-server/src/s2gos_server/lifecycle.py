@@ -0,0 +1,110 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Graceful shutdown of the S2GOS server.
+
+On `SIGTERM`, e.g., during a rolling deployment, the server first drains:
+the readiness endpoint `/health/ready` responds with 503, so that load
+balancers move traffic away, and the service's `drain()` method, if any,
+is called. Only then the server shuts down. Meanwhile, the server keeps
+answering requests, e.g., for the status of jobs. A second `SIGTERM`
+shuts down the server immediately.
+
+When the server starts, the service is loaded and its `resume_jobs()`
+method, if any, is awaited to resubmit the jobs checkpointed by a
+previous drain. When the server shuts down, the service's `close()`
+method, if any, is awaited, e.g., to stop background tasks.
+"""
+
+import contextlib
+import logging
+import signal
+import threading
+from collections.abc import AsyncIterator
+from typing import Any
+
+import fastapi
+from gavicore.service import Service
+from wraptile.provider import get_service
+
+LOG = logging.getLogger("uvicorn")
+
+_draining = threading.Event()
+
+
+def is_draining() -> bool:
+    """Whether the server is draining and about to shut down."""
+    return _draining.is_set()
+
+
+def install_lifecycle(app: fastapi.FastAPI):
+    """
+    Let `app` load its service on startup, drain it on `SIGTERM`, and
+    close it on shutdown, unless already done.
+    """
+    lifespan_context = app.router.lifespan_context
+    if getattr(lifespan_context, "__s2gos_lifecycle__", False):
+        return
+
+    @contextlib.asynccontextmanager
+    async def s2gos_lifespan(app_: Any) -> AsyncIterator[Any]:
+        service = get_service()
+        resume_jobs = getattr(service, "resume_jobs", None)
+        if resume_jobs is not None:
+            await resume_jobs()
+        install_sigterm_handler(service)
+        try:
+            async with lifespan_context(app_) as state:
+                yield state
+        finally:
+            close = getattr(service, "close", None)
+            if close is not None:
+                await close()
+
+    setattr(s2gos_lifespan, "__s2gos_lifecycle__", True)
+    app.router.lifespan_context = s2gos_lifespan
+
+
+def install_sigterm_handler(service: Service):
+    """
+    Install a `SIGTERM` handler that drains `service` before passing
+    the signal on to the previous handler, usually the one of the
+    server that shuts it down.
+
+    Does nothing if not called from the main thread.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    def handle_sigterm(sig: int, _frame: Any):
+        # A second SIGTERM skips draining
+        signal.signal(signal.SIGTERM, previous_handler)
+        if _draining.is_set():
+            return
+        _draining.set()
+        LOG.info("Received SIGTERM, draining service")
+        threading.Thread(
+            target=_drain_and_exit,
+            args=(service, sig, previous_handler),
+            name="s2gos-drain",
+            daemon=True,
+        ).start()
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+
+def _drain_and_exit(service: Service, sig: int, previous_handler: Any):
+    try:
+        drain = getattr(service, "drain", None)
+        if drain is not None:
+            drain()
+    except Exception:
+        LOG.exception("Draining the service failed")
+    finally:
+        LOG.info("Service drained, shutting down")
+        if callable(previous_handler):
+            previous_handler(sig, None)
+        else:
+            signal.raise_signal(sig)
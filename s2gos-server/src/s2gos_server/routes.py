@@ -0,0 +1,106 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""S2GOS-specific routes that extend the OGC API - Processes.
+
+The routes are added to the wraptile application by the `s2gos-server`
+CLI, see [include_s2gos_routes()][s2gos_server.routes.include_s2gos_routes].
+"""
+
+from typing import Literal
+
+import fastapi
+from gavicore.models import ProcessRequest
+from gavicore.service import Service
+from pydantic import BaseModel
+from wraptile.exceptions import ServiceException
+from wraptile.provider import get_service
+
+from s2gos_server.lifecycle import is_draining
+from s2gos_server.services.estimates import CostEstimate
+from s2gos_server.services.logs import DEFAULT_READ_LIMIT, JobLogChunk
+
+MAX_LOG_WAIT = 30.0
+
+s2gos_router = fastapi.APIRouter()
+
+
+class HealthStatus(BaseModel):
+    """The health of the server."""
+
+    status: Literal["alive", "ready", "draining"]
+
+
+@s2gos_router.get("/health/live", response_model=HealthStatus)
+async def get_liveness():
+    """Liveness probe, succeeds as long as the server responds."""
+    return HealthStatus(status="alive")
+
+
+@s2gos_router.get(
+    "/health/ready",
+    response_model=HealthStatus,
+    responses={503: {"model": HealthStatus}},
+)
+async def get_readiness(
+    response: fastapi.Response,
+    service: Service = fastapi.Depends(get_service),  # noqa B008
+):
+    """Readiness probe, fails while the server drains before shutting down."""
+    if is_draining() or getattr(service, "draining", False):
+        response.status_code = 503
+        return HealthStatus(status="draining")
+    return HealthStatus(status="ready")
+
+
+# noinspection PyPep8Naming
+@s2gos_router.get(
+    "/jobs/{jobId}/logs",
+    response_model=JobLogChunk,
+)
+async def get_job_logs(
+    jobId: str,
+    offset: int = fastapi.Query(0, ge=0, description="Byte offset to read from"),
+    limit: int = fastapi.Query(
+        DEFAULT_READ_LIMIT, gt=0, description="Maximum number of bytes to read"
+    ),
+    wait: float = fastapi.Query(
+        0.0,
+        ge=0.0,
+        le=MAX_LOG_WAIT,
+        description="Seconds to wait for new output if there is none yet",
+    ),
+    service: Service = fastapi.Depends(get_service),  # noqa B008
+):
+    get_job_logs_ = getattr(service, "get_job_logs", None)
+    if get_job_logs_ is None:
+        raise ServiceException(404, detail="Job logs are not supported by this service")
+    return await get_job_logs_(job_id=jobId, offset=offset, limit=limit, wait=wait)
+
+
+# noinspection PyPep8Naming
+@s2gos_router.post(
+    "/processes/{processID}/estimate",
+    response_model=CostEstimate,
+)
+async def estimate_process(
+    processID: str,
+    process_request: ProcessRequest,
+    service: Service = fastapi.Depends(get_service),  # noqa B008
+):
+    estimate_process_ = getattr(service, "estimate_process", None)
+    if estimate_process_ is None:
+        raise ServiceException(
+            404, detail="Cost estimates are not supported by this service"
+        )
+    return await estimate_process_(
+        process_id=processID, process_request=process_request
+    )
+
+
+def include_s2gos_routes(app: fastapi.FastAPI):
+    """Add the S2GOS-specific routes to `app`, unless already done."""
+    paths = {getattr(r, "path", None) for r in app.routes}
+    if not any(getattr(r, "path", None) in paths for r in s2gos_router.routes):
+        app.include_router(s2gos_router)
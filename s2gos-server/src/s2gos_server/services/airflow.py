@@ -0,0 +1,307 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""S2GOS Airflow service.
+
+A thin wrapper around wraptile's generic Airflow service that keeps
+job-status reads off the Airflow REST API:
+
+- DAG-run states of all DAGs are synchronized in bulk by a background
+  task, the most recently updated ones first, incrementally after the
+  first sync;
+- `get_job()` and `get_jobs()` are served from the local, size-bounded
+  DAG-run cache as long as it is fresh, cache misses fall back to Airflow;
+- a single Airflow client session with a sized connection pool is
+  reused for all calls;
+- the sync interval backs off exponentially while Airflow is failing
+  or slow, and is reset once it responds normally again.
+"""
+
+import asyncio
+import contextlib
+import datetime
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Optional
+
+import fastapi
+from airflow_client.client import ApiClient, Configuration
+from gavicore.models import JobInfo, JobList, JobStatus, ProcessRequest
+from wraptile.services.airflow import DEFAULT_AIRFLOW_BASE_URL, AirflowService
+
+DEFAULT_SYNC_INTERVAL = 5.0
+DEFAULT_MAX_SYNC_INTERVAL = 60.0
+DEFAULT_REQUEST_TIMEOUT = 10.0
+DEFAULT_POOL_MAXSIZE = 8
+DEFAULT_PAGE_LIMIT = 100
+DEFAULT_MAX_CACHED_JOBS = 10_000
+# Number of jobs per process returned by get_jobs(),
+# which is Airflow's default page size used by the base class.
+DEFAULT_JOBS_PER_PROCESS = 50
+
+TERMINAL_JOB_STATUSES = (
+    JobStatus.successful,
+    JobStatus.failed,
+    JobStatus.dismissed,
+)
+
+# Overlap between two incremental syncs, so that DAG runs updated while
+# the previous sync was in flight are not missed.
+_SYNC_OVERLAP = datetime.timedelta(seconds=5)
+
+
+class S2GOSAirflowService(AirflowService):
+    def __init__(
+        self,
+        title: str,
+        description: Optional[str] = None,
+    ):
+        super().__init__(title=title, description=description)
+        self._sync_interval = DEFAULT_SYNC_INTERVAL
+        self._max_sync_interval = DEFAULT_MAX_SYNC_INTERVAL
+        self._request_timeout = DEFAULT_REQUEST_TIMEOUT
+        self._pool_maxsize = DEFAULT_POOL_MAXSIZE
+        self._max_cached_jobs = DEFAULT_MAX_CACHED_JOBS
+        self._current_sync_interval = DEFAULT_SYNC_INTERVAL
+        # Ordered from least to most recently updated
+        self._job_cache: OrderedDict[str, JobInfo] = OrderedDict()
+        self._last_sync_time: Optional[float] = None
+        self._last_sync_date: Optional[datetime.datetime] = None
+        self._sync_task: Optional[asyncio.Task] = None
+
+    def configure(
+        self,
+        airflow_base_url: Optional[str] = None,
+        airflow_username: Optional[str] = None,
+        airflow_password: Optional[str] = None,
+        sync_interval: Optional[float] = None,
+        max_sync_interval: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+        pool_maxsize: Optional[int] = None,
+        max_cached_jobs: Optional[int] = None,
+    ):
+        """
+        Configure the S2GOS Airflow service.
+
+        Args:
+            airflow_base_url: The base URL of the Airflow web API, defaults to
+                `http://localhost:8080`.
+            airflow_username: The Airflow username, defaults to `admin`.
+            airflow_password: The Airflow password.
+                For an Airflow installation with the simple Auth manager,
+                use the one from
+                `.airflow/simple_auth_manager_passwords.json.generated`.
+            sync_interval: Seconds between two DAG-run syncs while Airflow
+                is healthy, defaults to 5.
+            max_sync_interval: Upper bound in seconds for the sync interval
+                when backing off from a failing or slow Airflow,
+                defaults to 60.
+            request_timeout: Timeout in seconds for a single Airflow request
+                made by the sync task, defaults to 10.
+            pool_maxsize: Maximum number of pooled connections of the
+                Airflow client session, defaults to 8.
+            max_cached_jobs: Maximum number of DAG runs kept in the cache,
+                defaults to 10000. The least recently updated ones are evicted.
+        """
+        super().configure(
+            airflow_base_url=airflow_base_url,
+            airflow_username=airflow_username,
+            airflow_password=airflow_password,
+        )
+        self._sync_interval = sync_interval or DEFAULT_SYNC_INTERVAL
+        self._max_sync_interval = max(
+            max_sync_interval or DEFAULT_MAX_SYNC_INTERVAL, self._sync_interval
+        )
+        self._request_timeout = request_timeout or DEFAULT_REQUEST_TIMEOUT
+        self._pool_maxsize = pool_maxsize or DEFAULT_POOL_MAXSIZE
+        self._max_cached_jobs = max_cached_jobs or DEFAULT_MAX_CACHED_JOBS
+        self._current_sync_interval = self._sync_interval
+
+    async def execute_process(
+        self, process_id: str, process_request: ProcessRequest, *args, **kwargs
+    ) -> JobInfo:
+        job_info = await super().execute_process(
+            process_id, process_request, *args, **kwargs
+        )
+        self._cache_jobs([job_info])
+        return job_info
+
+    async def get_jobs(self, request: fastapi.Request, *args, **kwargs) -> JobList:
+        self._ensure_sync_task()
+        if not self.is_cache_fresh():
+            return await super().get_jobs(request, *args, **kwargs)
+        # Like the base class, return one page of DAG runs per DAG
+        jobs_per_process: dict[Optional[str], list[JobInfo]] = {}
+        for job_info in reversed(self._job_cache.values()):
+            process_jobs = jobs_per_process.setdefault(job_info.processID, [])
+            if len(process_jobs) < DEFAULT_JOBS_PER_PROCESS:
+                process_jobs.append(job_info)
+        return JobList(
+            jobs=[j for jobs in jobs_per_process.values() for j in reversed(jobs)],
+            links=[self.get_self_link(request, name="get_jobs")],
+        )
+
+    async def get_job(self, job_id: str, *args, **kwargs) -> JobInfo:
+        self._ensure_sync_task()
+        job_info = self._job_cache.get(job_id)
+        if job_info is not None and (
+            job_info.status in TERMINAL_JOB_STATUSES or self.is_cache_fresh()
+        ):
+            return job_info
+        job_info = await super().get_job(job_id, *args, **kwargs)
+        self._cache_jobs([job_info])
+        return job_info
+
+    async def dismiss_job(self, job_id: str, *args, **kwargs) -> JobInfo:
+        job_info = await super().dismiss_job(job_id, *args, **kwargs)
+        # The DAG run will be re-synced with its final Airflow state.
+        self._job_cache.pop(job_id, None)
+        return job_info
+
+    def is_cache_fresh(self) -> bool:
+        """Whether the DAG-run cache has recently been synced successfully."""
+        if self._last_sync_time is None:
+            return False
+        # Not the backed-off interval, while Airflow is failing
+        # the cached states are not fresh.
+        age = time.monotonic() - self._last_sync_time
+        return age <= self._sync_interval + self._request_timeout
+
+    def sync_jobs(self) -> int:
+        """
+        Synchronize the DAG-run cache with Airflow.
+
+        The first sync fetches the most recently updated DAG runs of all
+        DAGs, up to the cache size, subsequent syncs only those updated
+        since the previous one. DAG runs are fetched page-wise across
+        all DAGs, hence the number of Airflow requests does not depend
+        on the number of DAGs.
+
+        The sync task fetches DAG runs in a worker thread, but updates
+        the cache on the event loop, which serves it.
+
+        Returns:
+            The number of synchronized DAG runs.
+
+        Raises:
+            ApiException: if an Airflow request failed.
+        """
+        return self._update_job_cache(*self._fetch_jobs())
+
+    def _fetch_jobs(self) -> tuple[datetime.datetime, list[JobInfo]]:
+        sync_date = datetime.datetime.now(datetime.timezone.utc)
+        updated_at_gte = (
+            self._last_sync_date - _SYNC_OVERLAP
+            if self._last_sync_date is not None
+            else None
+        )
+        dag_run_api = self.airflow_dag_run_api
+        job_infos: dict[str, JobInfo] = {}
+        offset = 0
+        while True:
+            dag_run_collection = dag_run_api.get_dag_runs(
+                "~",
+                limit=DEFAULT_PAGE_LIMIT,
+                offset=offset,
+                updated_at_gte=updated_at_gte,
+                order_by="-updated_at",
+                _request_timeout=self._request_timeout,
+            )
+            dag_runs = dag_run_collection.dag_runs
+            for dag_run in dag_runs:
+                job_infos[dag_run.dag_run_id] = self.dag_run_to_job_info(dag_run)
+            offset += len(dag_runs)
+            if (
+                not dag_runs
+                or offset >= dag_run_collection.total_entries
+                or len(job_infos) >= self._max_cached_jobs
+            ):
+                break
+        # Pages are ordered from most to least recently updated
+        return sync_date, list(reversed(job_infos.values()))
+
+    def _update_job_cache(
+        self, sync_date: datetime.datetime, job_infos: list[JobInfo]
+    ) -> int:
+        self._cache_jobs(job_infos)
+        self._last_sync_date = sync_date
+        self._last_sync_time = time.monotonic()
+        return len(job_infos)
+
+    def _cache_jobs(self, job_infos: Iterable[JobInfo]):
+        for job_info in job_infos:
+            self._job_cache[job_info.jobID] = job_info
+            self._job_cache.move_to_end(job_info.jobID)
+        while len(self._job_cache) > self._max_cached_jobs:
+            self._job_cache.popitem(last=False)
+
+    async def run_sync_loop(self):
+        """Run the DAG-run sync loop until cancelled."""
+        while True:
+            await self._sync_once()
+            await asyncio.sleep(self._current_sync_interval)
+
+    async def _sync_once(self):
+        start_time = time.monotonic()
+        try:
+            sync_date, job_infos = await asyncio.to_thread(self._fetch_jobs)
+        except Exception as e:
+            self._back_off(f"Syncing DAG runs from Airflow failed: {e}")
+            return
+        count = self._update_job_cache(sync_date, job_infos)
+        duration = time.monotonic() - start_time
+        if duration > self._sync_interval:
+            self._back_off(
+                f"Syncing {count} DAG runs from Airflow took {duration:.1f} seconds"
+            )
+        else:
+            self._current_sync_interval = self._sync_interval
+
+    def _back_off(self, reason: str):
+        self._current_sync_interval = min(
+            2 * self._current_sync_interval, self._max_sync_interval
+        )
+        self.logger.warning(
+            f"{reason}, next sync in {self._current_sync_interval:.1f} seconds."
+        )
+
+    async def close(self):
+        """Stop the DAG-run sync task, if running."""
+        sync_task, self._sync_task = self._sync_task, None
+        if sync_task is not None and not sync_task.done():
+            sync_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sync_task
+
+    def _ensure_sync_task(self):
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.get_running_loop().create_task(
+                self.run_sync_loop()
+            )
+
+    @property
+    def airflow_client(self) -> ApiClient:
+        if self._api_client is None:
+            configuration = Configuration(
+                host=(
+                    self._airflow_base_url
+                    or os.getenv("AIRFLOW_API_BASE_URL")
+                    or DEFAULT_AIRFLOW_BASE_URL
+                )
+            )
+            configuration.connection_pool_maxsize = self._pool_maxsize
+            self._api_client = ApiClient(configuration)
+        # The base class refreshes the bearer token of the pooled session.
+        return super().airflow_client
+
+
+service = S2GOSAirflowService(
+    title="S2GOS Airflow Service",
+    description=(
+        "The ESA DTE-S2GOS gateway API compliant with OGC API - Processes"
+        " that uses an Airflow backend."
+    ),
+)
@@ -0,0 +1,243 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""In-process artifact cache for chained processes.
+
+Processes that run one after another in the same worker, such as scene
+generation followed by simulation, usually only pass on a path. The next
+process then re-reads and re-parses what the previous one just wrote.
+An [ArtifactCache][s2gos_server.services.artifacts.ArtifactCache] lets the
+first process hand over the loaded object instead, keyed by an identifier
+such as the scene path, while writing it to storage in the background.
+"""
+
+import logging
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Optional
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+LOG = logging.getLogger("uvicorn")
+
+
+class ArtifactCache:
+    """
+    A thread-safe, size-bounded LRU cache of loaded artifacts.
+
+    If the total size of the cached artifacts exceeds `max_size`, the least
+    recently used artifacts are evicted. Artifacts that are still being
+    persisted are served from memory until persisting has finished, also
+    if evicted, so that they are never loaded from incomplete storage.
+
+    Args:
+        max_size: Maximum total size of the cached artifacts in bytes,
+            defaults to 512 MiB. Zero disables caching, but artifacts are
+            still persisted.
+        max_persist_workers: Maximum number of artifacts persisted
+            concurrently, defaults to 2.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, max_persist_workers: int = 2):
+        self.max_size = max_size
+        self.size = 0
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._loading: dict[str, Future] = {}
+        self._persisting: set[Future] = set()
+        # The most recently put artifacts still being persisted, by key
+        self._persisting_values: dict[str, tuple[Any, Future]] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_persist_workers, thread_name_prefix="s2gos-artifacts"
+        )
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get the artifact for `key`, or `default` if it is neither cached
+        nor being persisted.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+            persisting = self._persisting_values.get(key)
+            return persisting[0] if persisting is not None else default
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        size: Optional[int] = None,
+        persist: Optional[Callable[[Any], Any]] = None,
+    ) -> Optional[Future]:
+        """
+        Cache an artifact and optionally persist it in the background.
+
+        Args:
+            key: The artifact identifier, e.g., a scene path.
+            value: The loaded artifact.
+            size: The artifact's size in bytes. Estimated if not given.
+            persist: Optional function that writes `value` to storage.
+                It is called in a background thread.
+
+        Returns:
+            The future of the persist function, if given.
+        """
+        self._add(key, value, size)
+        if persist is None:
+            return None
+        future = self._executor.submit(persist, value)
+        with self._lock:
+            self._persisting.add(future)
+            self._persisting_values[key] = value, future
+        future.add_done_callback(lambda f: self._on_persisted(key, f))
+        return future
+
+    def get_or_load(
+        self,
+        key: str,
+        load: Callable[[str], Any],
+        size: Optional[int] = None,
+    ) -> Any:
+        """
+        Get the artifact for `key`, loading and caching it if neither
+        cached nor being persisted.
+
+        If multiple threads request the same uncached artifact concurrently,
+        it is loaded only once.
+
+        Args:
+            key: The artifact identifier.
+            load: Function that loads the artifact given its identifier.
+            size: The artifact's size in bytes. Estimated if not given.
+
+        Returns:
+            The artifact.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[0]
+            persisting = self._persisting_values.get(key)
+            if persisting is not None:
+                return persisting[0]
+            future = self._loading.get(key)
+            loader = future is None
+            if loader:
+                future = self._loading[key] = Future()
+        assert future is not None
+        if not loader:
+            return future.result()
+        try:
+            value = load(key)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self._add(key, value, size)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._loading.pop(key, None)
+
+    def remove(self, key: str):
+        """Remove the artifact for `key`, if cached."""
+        with self._lock:
+            self._persisting_values.pop(key, None)
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def clear(self):
+        """Remove all cached artifacts."""
+        with self._lock:
+            self._entries.clear()
+            self._persisting_values.clear()
+            self.size = 0
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all artifacts have been persisted.
+
+        Args:
+            timeout: Maximum number of seconds to wait.
+
+        Returns:
+            `True` if all artifacts have been persisted.
+        """
+        with self._lock:
+            pending = set(self._persisting)
+        _done, not_done = wait(pending, timeout=timeout)
+        return not not_done
+
+    def _add(self, key: str, value: Any, size: Optional[int]):
+        size = get_size(value) if size is None else size
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self.size -= old_entry[1]
+            if size > self.max_size:
+                return
+            self._entries[key] = value, size
+            self.size += size
+            while self.size > self.max_size:
+                _key, (_value, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+
+    def _on_persisted(self, key: str, future: Future):
+        with self._lock:
+            self._persisting.discard(future)
+            persisting = self._persisting_values.get(key)
+            if persisting is not None and persisting[1] is future:
+                del self._persisting_values[key]
+        if not future.cancelled() and future.exception() is not None:
+            LOG.error(
+                f"Failed to persist artifact {key!r}", exc_info=future.exception()
+            )
+
+
+def get_size(value: Any) -> int:
+    """
+    Estimate the memory size of `value` in bytes.
+
+    Uses the `nbytes` attribute of array-like objects, and
+    recurses into lists, tuples, sets, and dictionaries.
+    Objects referenced more than once, also in cycles, are
+    counted once. For large nested objects, pass an explicit
+    size to the cache instead, as this visits every item.
+    """
+    size = 0
+    seen: set[int] = set()
+    # Iterate rather than recurse to support deeply nested values
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        nbytes = getattr(value, "nbytes", None)
+        if isinstance(nbytes, int):
+            size += nbytes
+            continue
+        size += sys.getsizeof(value)
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            stack.extend(value)
+    return size
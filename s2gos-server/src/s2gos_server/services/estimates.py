@@ -0,0 +1,318 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Dry-run cost estimates.
+
+Every successful job is recorded with its inputs, its total runtime, the
+durations of its stages, and the size of its outputs. Process functions
+report stages using [job_stage()][s2gos_server.services.estimates.job_stage]
+and output sizes using
+[add_output_size()][s2gos_server.services.estimates.add_output_size].
+
+A [CostModel][s2gos_server.services.estimates.CostModel] fits a regularized
+linear model per process on features derived from the inputs: numeric
+inputs, one-hot encoded enumeration inputs, and the products of both. The
+latter let, e.g., the cost per sample differ per observation type.
+"""
+
+import contextlib
+import enum
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+from s2gos_server.services.jobs import get_current_job_id
+
+DEFAULT_MAX_RECORDS = 1000
+"""Default number of recorded jobs kept per process."""
+
+_RIDGE_PENALTY = 1e-3
+
+
+class CostEstimate(BaseModel):
+    """The predicted cost of executing a process request."""
+
+    processID: str = Field(description="Process identifier")
+    runtime: Optional[float] = Field(
+        default=None, description="Predicted runtime in seconds, if known"
+    )
+    stages: dict[str, float] = Field(
+        default_factory=dict, description="Predicted runtime in seconds per stage"
+    )
+    outputSize: Optional[int] = Field(
+        default=None, description="Predicted size of the outputs in bytes, if known"
+    )
+    sampleCount: int = Field(
+        description="Number of recorded jobs the prediction is based on"
+    )
+
+
+class CostRecord(BaseModel):
+    """The recorded cost of a successful job."""
+
+    processID: str
+    features: dict[str, float]
+    runtime: float
+    stages: dict[str, float] = Field(default_factory=dict)
+    outputSize: Optional[int] = None
+
+
+# ----------------------------------------------------------------------------
+# Metrics reported by running jobs
+
+
+@dataclass
+class JobMetrics:
+    """Metrics reported by a running job."""
+
+    stages: dict[str, float] = field(default_factory=dict)
+    output_size: Optional[int] = None
+
+
+_job_metrics: dict[str, JobMetrics] = {}
+_job_metrics_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def job_stage(name: str) -> Iterator[None]:
+    """
+    Record the duration of a stage of the current job.
+    Does nothing if the caller is not part of a job.
+
+    Args:
+        name: The stage name, e.g., `"generation"`.
+    """
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        job_id = get_current_job_id()
+        if job_id is not None:
+            duration = time.monotonic() - start
+            with _job_metrics_lock:
+                stages = _job_metrics.setdefault(job_id, JobMetrics()).stages
+                stages[name] = stages.get(name, 0.0) + duration
+
+
+def add_output_size(size: int):
+    """
+    Add `size` bytes to the output size of the current job.
+    Does nothing if the caller is not part of a job.
+    """
+    job_id = get_current_job_id()
+    if job_id is not None:
+        with _job_metrics_lock:
+            metrics = _job_metrics.setdefault(job_id, JobMetrics())
+            metrics.output_size = (metrics.output_size or 0) + size
+
+
+def pop_job_metrics(job_id: str) -> JobMetrics:
+    """Remove and return the metrics reported by the given job."""
+    with _job_metrics_lock:
+        return _job_metrics.pop(job_id, None) or JobMetrics()
+
+
+# ----------------------------------------------------------------------------
+# Cost model
+
+
+def get_features(inputs: Mapping[str, Any]) -> dict[str, float]:
+    """
+    Derive the model features from the normalized inputs of a job.
+
+    Numbers and booleans are used as they are, enumeration values are
+    one-hot encoded and additionally multiplied with each number.
+    Other inputs, such as free-form names, are ignored.
+    """
+    numbers: dict[str, float] = {}
+    categories: list[str] = []
+    for name, value in inputs.items():
+        if isinstance(value, enum.Enum):
+            categories.append(f"{name}={value.value}")
+        elif isinstance(value, (bool, int, float)) and math.isfinite(value):
+            numbers[name] = float(value)
+    features = dict(numbers)
+    for category in categories:
+        features[category] = 1.0
+        for name, number in numbers.items():
+            features[f"{name}*{category}"] = number
+    return features
+
+
+class CostModel:
+    """
+    Predicts the cost of jobs from the recorded costs of past jobs.
+
+    Args:
+        records_path: Optional JSON Lines file the records are appended to.
+            Existing records are loaded from it.
+        max_records: Maximum number of most recent records used per process.
+    """
+
+    def __init__(
+        self,
+        records_path: Optional[Path | str] = None,
+        max_records: int = DEFAULT_MAX_RECORDS,
+    ):
+        self.max_records = max_records
+        self._records: dict[str, deque[CostRecord]] = defaultdict(
+            lambda: deque(maxlen=self.max_records)
+        )
+        self._fits: dict[str, dict[str, _LinearFit]] = {}
+        self._lock = threading.Lock()
+        self.records_path: Optional[Path] = None
+        if records_path is not None:
+            self.load(records_path)
+
+    def load(self, records_path: Path | str):
+        """Load the records from the given file and append new ones to it."""
+        records_path = Path(records_path)
+        with self._lock:
+            self.records_path = records_path
+            if records_path.exists():
+                with records_path.open() as fp:
+                    for line in fp:
+                        if line.strip():
+                            self._add(CostRecord.model_validate_json(line))
+
+    def record(
+        self,
+        process_id: str,
+        inputs: Mapping[str, Any],
+        runtime: float,
+        stages: Optional[Mapping[str, float]] = None,
+        output_size: Optional[int] = None,
+    ) -> CostRecord:
+        """Record the cost of a successful job."""
+        record = CostRecord(
+            processID=process_id,
+            features=get_features(inputs),
+            runtime=runtime,
+            stages=dict(stages or {}),
+            outputSize=output_size,
+        )
+        with self._lock:
+            self._add(record)
+            if self.records_path is not None:
+                self.records_path.parent.mkdir(parents=True, exist_ok=True)
+                with self.records_path.open("a") as fp:
+                    fp.write(record.model_dump_json() + "\n")
+        return record
+
+    def estimate(self, process_id: str, inputs: Mapping[str, Any]) -> CostEstimate:
+        """Predict the cost of executing a process with the given inputs."""
+        features = get_features(inputs)
+        with self._lock:
+            records = self._records.get(process_id)
+            if not records:
+                return CostEstimate(processID=process_id, sampleCount=0)
+            fits = self._fits.get(process_id)
+            if fits is None:
+                fits = self._fits[process_id] = _fit_records(list(records))
+            sample_count = len(records)
+
+        def predict(target: str) -> Optional[float]:
+            fit = fits.get(target)
+            return max(0.0, fit.predict(features)) if fit is not None else None
+
+        output_size = predict("outputSize")
+        return CostEstimate(
+            processID=process_id,
+            runtime=predict("runtime"),
+            stages={
+                target.removeprefix("stage:"): predict(target) or 0.0
+                for target in fits
+                if target.startswith("stage:")
+            },
+            outputSize=round(output_size) if output_size is not None else None,
+            sampleCount=sample_count,
+        )
+
+    def _add(self, record: CostRecord):
+        self._records[record.processID].append(record)
+        self._fits.pop(record.processID, None)
+
+
+def _fit_records(records: list[CostRecord]) -> dict[str, "_LinearFit"]:
+    targets: dict[str, list[tuple[dict[str, float], float]]] = defaultdict(list)
+    for record in records:
+        targets["runtime"].append((record.features, record.runtime))
+        for stage, duration in record.stages.items():
+            targets[f"stage:{stage}"].append((record.features, duration))
+        if record.outputSize is not None:
+            targets["outputSize"].append((record.features, float(record.outputSize)))
+    return {target: _LinearFit.fit(samples) for target, samples in targets.items()}
+
+
+@dataclass
+class _LinearFit:
+    names: list[str]
+    scales: list[float]
+    intercept: float
+    coefficients: list[float]
+
+    @classmethod
+    def fit(cls, samples: list[tuple[dict[str, float], float]]) -> "_LinearFit":
+        names = sorted({name for features, _ in samples for name in features})
+        # Scale features to [-1, 1], so that the penalty affects all alike
+        scales = [
+            max((abs(features.get(name, 0.0)) for features, _ in samples), default=0.0)
+            or 1.0
+            for name in names
+        ]
+        rows = [
+            [1.0] + [features.get(n, 0.0) / s for n, s in zip(names, scales)]
+            for features, _ in samples
+        ]
+        values = [value for _, value in samples]
+        size = len(names) + 1
+        # Normal equations of ridge regression, the intercept is not penalized
+        a = [
+            [sum(row[i] * row[j] for row in rows) for j in range(size)]
+            for i in range(size)
+        ]
+        b = [sum(row[i] * y for row, y in zip(rows, values)) for i in range(size)]
+        for i in range(1, size):
+            a[i][i] += _RIDGE_PENALTY * len(rows)
+        solution = _solve(a, b)
+        return cls(
+            names=names,
+            scales=scales,
+            intercept=solution[0],
+            coefficients=solution[1:],
+        )
+
+    def predict(self, features: Mapping[str, float]) -> float:
+        return self.intercept + sum(
+            c * features.get(n, 0.0) / s
+            for n, s, c in zip(self.names, self.scales, self.coefficients)
+        )
+
+
+def _solve(a: list[list[float]], b: list[float]) -> list[float]:
+    """Solve `a x = b` using Gaussian elimination with partial pivoting."""
+    n = len(b)
+    m = [row[:] + [v] for row, v in zip(a, b)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        if abs(m[pivot][col]) < 1e-12:
+            continue
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(col + 1, n):
+            factor = m[r][col] / m[col][col]
+            if factor:
+                for c in range(col, n + 1):
+                    m[r][c] -= factor * m[col][c]
+    x = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        if abs(m[r][r]) >= 1e-12:
+            x[r] = (m[r][n] - sum(m[r][c] * x[c] for c in range(r + 1, n))) / m[r][r]
+    return x
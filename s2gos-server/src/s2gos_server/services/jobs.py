@@ -0,0 +1,34 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import contextlib
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Optional
+
+from procodile import Job
+
+_current_job: ContextVar[Optional[Job]] = ContextVar("current_job", default=None)
+
+
+@contextlib.contextmanager
+def bind_job(job: Job) -> Iterator[None]:
+    """
+    Make `job` the current job of the calling thread while the
+    context is active, see `get_current_job_id()`.
+    """
+    token = _current_job.set(job)
+    try:
+        yield
+    finally:
+        _current_job.reset(token)
+
+
+def get_current_job_id() -> Optional[str]:
+    """
+    Get the identifier of the job that is running in the current thread,
+    or `None` if the caller is not part of a job bound by `bind_job()`.
+    """
+    job = _current_job.get()
+    return job.job_info.jobID if job is not None else None
@@ -0,0 +1,418 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+from gavicore.models import JobInfo, JobStatus, ProcessRequest
+from procodile import Job, ProcessRegistry
+from pydantic import ValidationError
+from wraptile.exceptions import ServiceException
+from wraptile.services.local import LocalService
+
+from s2gos_server.services.artifacts import ArtifactCache
+from s2gos_server.services.estimates import CostEstimate, CostModel, pop_job_metrics
+from s2gos_server.services.jobs import bind_job
+from s2gos_server.services.logs import (
+    DEFAULT_READ_LIMIT,
+    JobLogChunk,
+    JobLogStore,
+    install_log_capture,
+    trim_to_char_boundary,
+)
+
+DEFAULT_DRAIN_TIMEOUT = 30.0
+
+T = TypeVar("T")
+
+
+class S2GOSLocalService(LocalService):
+    """
+    A local service that additionally captures the output of its jobs,
+    which can be read from the `/jobs/{jobId}/logs` endpoint, and records
+    the cost of its jobs to estimate the cost of new process requests
+    using the `/processes/{processID}/estimate` endpoint.
+
+    Processes can hand over loaded artifacts, such as scenes, to subsequent
+    processes run by the same worker through the service's `artifacts`, an
+    [ArtifactCache][s2gos_server.services.artifacts.ArtifactCache].
+
+    Before the server shuts down, `drain()` stops accepting new jobs, waits
+    for running jobs, and checkpoints unfinished jobs, which `resume_jobs()`
+    resubmits when the server starts again.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        process_registry: ProcessRegistry | None = None,
+    ):
+        super().__init__(
+            title=title, description=description, process_registry=process_registry
+        )
+        self.job_logs = JobLogStore()
+        self.cost_model = CostModel()
+        self.artifacts = ArtifactCache()
+        self.max_estimated_runtime: Optional[float] = None
+        self.drain_timeout = DEFAULT_DRAIN_TIMEOUT
+        self.checkpoint_path: Optional[Path] = None
+        self.draining = False
+        self._job_requests: dict[str, tuple[str, ProcessRequest]] = {}
+        self._submit_lock = threading.Lock()
+
+    def configure(
+        self,
+        processes: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        log_buffer_size: Optional[int] = None,
+        log_spill_dir: Optional[str] = None,
+        cost_records_path: Optional[str] = None,
+        max_estimated_runtime: Optional[float] = None,
+        artifact_cache_size: Optional[int] = None,
+        drain_timeout: Optional[float] = None,
+        checkpoint_path: Optional[str] = None,
+    ):
+        """
+        Configure the S2GOS local service.
+
+        Args:
+            processes: Whether to use processes instead of threads. Defaults to threads.
+                Job output is only captured, and job costs are only recorded,
+                if threads are used.
+            max_workers: The maximum number of processes or threads. Defaults to 3.
+            log_buffer_size: Maximum number of bytes of a job's output kept in
+                memory. Defaults to 256 KiB.
+            log_spill_dir: Directory that receives the output evicted from memory.
+                If not given, evicted output is dropped.
+            cost_records_path: JSON Lines file that persists the recorded job
+                costs across restarts. If not given, costs are kept in memory.
+            max_estimated_runtime: If given, reject process requests whose
+                estimated runtime in seconds exceeds this value.
+            artifact_cache_size: Maximum number of bytes of artifacts kept in
+                memory for subsequent processes. Defaults to 512 MiB,
+                zero disables the cache.
+            drain_timeout: Seconds to wait for running jobs when the
+                server shuts down. Defaults to 30.
+            checkpoint_path: JSON file that receives the unfinished jobs
+                when the server shuts down, so they are resubmitted when
+                it starts again. If not given, unfinished jobs are lost.
+        """
+        super().configure(processes=processes, max_workers=max_workers)
+        if isinstance(self.executor, ThreadPoolExecutor):
+            # Let jobs wait until _submit_job() has assigned their job IDs
+            self.executor.shutdown(wait=False)
+            self.executor = _JobThreadPoolExecutor(
+                self._submit_lock, max_workers=self._executor_max_workers
+            )
+        # Note, configure() is called again by the base class to recreate
+        # its executor, so we must not drop existing state here.
+        if log_buffer_size is not None:
+            self.job_logs.max_memory_size = log_buffer_size
+        if log_spill_dir is not None:
+            self.job_logs.spill_dir = Path(log_spill_dir)
+        if cost_records_path is not None:
+            if self.cost_model.records_path != Path(cost_records_path):
+                self.cost_model.load(cost_records_path)
+        if max_estimated_runtime is not None:
+            self.max_estimated_runtime = max_estimated_runtime
+        if artifact_cache_size is not None:
+            self.artifacts.max_size = artifact_cache_size
+        if drain_timeout is not None:
+            self.drain_timeout = drain_timeout
+        if checkpoint_path is not None:
+            self.checkpoint_path = Path(checkpoint_path)
+        install_log_capture(self.job_logs)
+
+    async def execute_process(
+        self, process_id: str, process_request: ProcessRequest, **kwargs
+    ) -> JobInfo:
+        return await self._execute_process(process_id, process_request)
+
+    async def _execute_process(
+        self,
+        process_id: str,
+        process_request: ProcessRequest,
+        job_id: Optional[str] = None,
+    ) -> JobInfo:
+        if self.draining:
+            raise ServiceException(
+                503,
+                detail="Service is shutting down and does not accept new jobs",
+            )
+        if self.max_estimated_runtime is not None:
+            estimate = await self.estimate_process(process_id, process_request)
+            if (
+                estimate.runtime is not None
+                and estimate.runtime > self.max_estimated_runtime
+            ):
+                raise ServiceException(
+                    400,
+                    detail=(
+                        f"Estimated runtime of {estimate.runtime:.0f} seconds"
+                        f" exceeds the limit of {self.max_estimated_runtime:.0f}"
+                        f" seconds for process {process_id!r}"
+                    ),
+                    type_id="bad-request",
+                )
+        job = await self._submit_job(
+            process_id, process_request, job_id or f"job_{uuid.uuid4().hex}"
+        )
+        job_id = job.job_info.jobID
+        self.job_logs.get_or_create(job_id)
+        self._job_requests[job_id] = process_id, process_request
+        assert job.future is not None
+        job.future.add_done_callback(lambda _f: self._on_job_done(process_id, job))
+        return job.job_info
+
+    async def _submit_job(
+        self, process_id: str, process_request: ProcessRequest, job_id: str
+    ) -> Job:
+        # The base class numbers jobs from job_0 on every start. Re-key the
+        # submitted job, so that job IDs are unique also across restarts,
+        # e.g., for spill files and clients that cache jobs, and resumed
+        # jobs keep their IDs. The base class does not suspend, and while
+        # we hold the lock, jobs cannot start with the base class' job ID.
+        with self._submit_lock:
+            job_info = await super().execute_process(process_id, process_request)
+            job = self.jobs.pop(job_info.jobID)
+            use_processes = self.job_uses_processes.pop(job_info.jobID)
+            job.job_info.jobID = job_id
+            self.jobs[job_id] = job
+            self.job_uses_processes[job_id] = use_processes
+
+        def update_job(future: Future):
+            self._update_job_from_future(job_id, future, use_processes=use_processes)
+            # Jobs run in processes report the job ID of the base class
+            job.job_info.jobID = job_id
+
+        assert job.future is not None
+        job.future.add_done_callback(update_job)
+        return job
+
+    async def estimate_process(
+        self, process_id: str, process_request: ProcessRequest
+    ) -> CostEstimate:
+        """
+        Estimate the cost of executing a process without executing it.
+
+        Args:
+            process_id: The process identifier.
+            process_request: The process request.
+
+        Returns:
+            The estimated runtime and output size.
+        """
+        process = self._get_process(process_id)
+        try:
+            job = Job.create(process, process_request)
+        except ValidationError as e:
+            raise ServiceException(
+                400,
+                detail=f"Invalid parameterization for process {process_id!r}: {e}",
+                exception=e,
+                type_id="bad-request",
+            ) from e
+        # Fitting the cost model may take a while
+        return await asyncio.to_thread(
+            self.cost_model.estimate, process_id, job.function_kwargs
+        )
+
+    def _on_job_done(self, process_id: str, job: Job):
+        job_info = job.job_info
+        self._job_requests.pop(job_info.jobID, None)
+        self.job_logs.finish(job_info.jobID)
+        metrics = pop_job_metrics(job_info.jobID)
+        # Jobs run in processes report neither stages nor output sizes
+        if (
+            job_info.status == JobStatus.successful
+            and not self.job_uses_processes.get(job_info.jobID, False)
+            and job_info.started is not None
+            and job_info.finished is not None
+        ):
+            self.cost_model.record(
+                process_id,
+                job.function_kwargs,
+                runtime=(job_info.finished - job_info.started).total_seconds(),
+                stages=metrics.stages,
+                output_size=metrics.output_size,
+            )
+
+    def drain(self, timeout: Optional[float] = None):
+        """
+        Prepare the service for shutdown.
+
+        New jobs are rejected and queued jobs are cancelled. Running jobs
+        are given `timeout` seconds to finish. The queued jobs and the jobs
+        still running are then written to the checkpoint file, if configured.
+        Finally, job output and artifacts are flushed to storage.
+
+        Args:
+            timeout: Seconds to wait for running jobs.
+                Defaults to the configured `drain_timeout`.
+        """
+        timeout = self.drain_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        self.draining = True
+        job_requests = dict(self._job_requests)
+        unfinished: list[str] = []
+        running = []
+        for job_id in job_requests:
+            job = self.jobs.get(job_id)
+            if job is None or job.future is None:
+                continue
+            if job.future.cancel():
+                unfinished.append(job_id)
+            elif not job.future.done():
+                running.append(job.future)
+        if running:
+            self.logger.info(f"Waiting for {len(running)} running job(s)")
+            wait(running, timeout=timeout)
+        for job_id in job_requests:
+            job = self.jobs.get(job_id)
+            if job is not None and job.future is not None and not job.future.done():
+                job.cancel()
+                unfinished.append(job_id)
+        if unfinished:
+            self._write_checkpoint(
+                {
+                    job_id: job_request
+                    for job_id, job_request in job_requests.items()
+                    if job_id in unfinished
+                }
+            )
+        self.job_logs.flush()
+        self.artifacts.flush(timeout=max(0.0, deadline - time.monotonic()))
+
+    async def resume_jobs(self) -> list[JobInfo]:
+        """
+        Resubmit the jobs checkpointed by a previous `drain()`.
+
+        Resubmitted jobs keep their job identifiers.
+        The checkpoint file is removed afterwards.
+
+        Returns:
+            The information of the resubmitted jobs.
+        """
+        path = self.checkpoint_path
+        if path is None or not path.exists():
+            return []
+        checkpoint = json.loads(path.read_text())
+        path.unlink()
+        job_infos = []
+        for entry in checkpoint.get("jobs", []):
+            try:
+                job_info = await self._execute_process(
+                    entry["processID"],
+                    ProcessRequest(**entry["request"]),
+                    job_id=entry["jobID"],
+                )
+            except Exception as e:
+                self.logger.error(f"Cannot resume job {entry.get('jobID')!r}: {e}")
+                continue
+            self.logger.info(f"Resumed job {job_info.jobID!r}")
+            job_infos.append(job_info)
+        return job_infos
+
+    def _write_checkpoint(self, job_requests: dict[str, tuple[str, ProcessRequest]]):
+        if self.checkpoint_path is None:
+            self.logger.warning(
+                f"Dropping {len(job_requests)} unfinished job(s),"
+                f" no checkpoint path configured"
+            )
+            return
+        checkpoint = {
+            "jobs": [
+                {
+                    "jobID": job_id,
+                    "processID": process_id,
+                    "request": process_request.model_dump(
+                        mode="json", exclude_unset=True
+                    ),
+                }
+                for job_id, (process_id, process_request) in job_requests.items()
+            ]
+        }
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(checkpoint, indent=2))
+        tmp_path.replace(self.checkpoint_path)
+        self.logger.info(
+            f"Checkpointed {len(job_requests)} unfinished job(s)"
+            f" to {self.checkpoint_path}"
+        )
+
+    async def dismiss_job(self, job_id: str, *args, **kwargs) -> JobInfo:
+        job_info = await super().dismiss_job(job_id, *args, **kwargs)
+        if job_id not in self.jobs:
+            self.job_logs.remove(job_id)
+        return job_info
+
+    async def get_job_logs(
+        self,
+        job_id: str,
+        offset: int = 0,
+        limit: int = DEFAULT_READ_LIMIT,
+        wait: float = 0.0,
+    ) -> JobLogChunk:
+        """
+        Get the output of a job starting at the given byte offset.
+
+        Args:
+            job_id: The job identifier.
+            offset: The byte offset to start reading from.
+            limit: The maximum number of bytes to read.
+            wait: Seconds to wait for new output if there is none yet.
+
+        Returns:
+            The requested log chunk.
+        """
+        self._get_job(job_id, forbidden_status_codes={})
+        job_log = self.job_logs.get_or_create(job_id)
+        if wait > 0 and job_log.size <= offset and not job_log.finished:
+            await asyncio.to_thread(job_log.wait, offset, wait)
+        offset, data = job_log.read(offset, limit)
+        if len(data) == limit:
+            # Avoid splitting lines and multibyte characters
+            end = data.rfind(b"\n") + 1
+            data = data[:end] if end > 0 else trim_to_char_boundary(data)
+        next_offset = offset + len(data)
+        return JobLogChunk(
+            jobID=job_id,
+            offset=offset,
+            nextOffset=next_offset,
+            text=data.decode("utf-8", errors="replace"),
+            finished=job_log.finished and next_offset >= job_log.size,
+        )
+
+
+class _JobThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    A thread pool whose jobs wait for `gate` to be released before they run,
+    and are bound to the thread running them, see `bind_job()`.
+    """
+
+    def __init__(self, gate: threading.Lock, max_workers: int):
+        super().__init__(max_workers=max_workers)
+        self.gate = gate
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        # Jobs are submitted as their bound Job.run() method
+        job = getattr(fn, "__self__", None)
+
+        def run() -> T:
+            with self.gate:
+                pass
+            if not isinstance(job, Job):
+                return fn(*args, **kwargs)
+            with bind_job(job):
+                return fn(*args, **kwargs)
+
+        return super().submit(run)
@@ -0,0 +1,314 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Per-job log capture.
+
+The output that process functions write to `sys.stdout` and `sys.stderr`
+(e.g., using `print()`) is captured per job into a
+[JobLog][s2gos_server.services.logs.JobLog]. A job log keeps only its most
+recent bytes in a bounded in-memory ring buffer. Older bytes are spilled
+to a file, if a spill directory is configured, or dropped otherwise.
+Once a job has finished, its log is moved to the spill file entirely.
+Without a spill directory, only the logs of the most recently finished
+jobs are kept in memory.
+
+Logs are addressed by byte offsets, so that clients can incrementally
+read new output by passing the `nextOffset` of their previous read.
+"""
+
+import sys
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, TextIO
+
+from pydantic import BaseModel, Field
+
+from s2gos_server.services.jobs import get_current_job_id
+
+DEFAULT_MAX_MEMORY_SIZE = 256 * 1024
+DEFAULT_READ_LIMIT = 64 * 1024
+DEFAULT_MAX_FINISHED_LOGS = 100
+
+
+class JobLogChunk(BaseModel):
+    """A chunk of a job's log."""
+
+    jobID: str = Field(description="Job identifier")
+    offset: int = Field(description="Byte offset of the first byte of `text`")
+    nextOffset: int = Field(description="Byte offset to continue reading from")
+    text: str = Field(description="Log text")
+    finished: bool = Field(
+        description="Whether the job has finished and `nextOffset` is the log's end"
+    )
+
+
+class JobLog:
+    """
+    The log of a single job.
+
+    Args:
+        max_memory_size: Maximum number of bytes kept in memory.
+        spill_path: Optional file that receives bytes evicted from memory.
+    """
+
+    def __init__(
+        self,
+        max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE,
+        spill_path: Optional[Path] = None,
+    ):
+        self.max_memory_size = max_memory_size
+        self.spill_path = spill_path
+        if spill_path is not None:
+            # Left over from a previous job with the same ID
+            spill_path.unlink(missing_ok=True)
+        self._buffer = bytearray()
+        # Byte offset of the first byte in _buffer
+        self._buffer_offset = 0
+        self._spill_file: Optional[BinaryIO] = None
+        self._finished = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """The total number of bytes written to this log."""
+        return self._buffer_offset + len(self._buffer)
+
+    @property
+    def finished(self) -> bool:
+        """Whether this log has been finished."""
+        return self._finished
+
+    def write(self, text: str) -> int:
+        data = text.encode("utf-8", errors="replace")
+        with self._condition:
+            self._buffer.extend(data)
+            excess = len(self._buffer) - self.max_memory_size
+            if excess > 0:
+                self._spill(self._buffer[:excess])
+                del self._buffer[:excess]
+                self._buffer_offset += excess
+            self._condition.notify_all()
+        return len(text)
+
+    def finish(self):
+        """
+        Mark this log as complete and wake up waiting readers.
+        The bytes kept in memory are moved to the spill file, if any.
+        """
+        with self._condition:
+            self._finished = True
+            self.flush()
+            self._condition.notify_all()
+
+    def flush(self):
+        """
+        Move all bytes kept in memory to the spill file, if any,
+        so that the complete log is on disk.
+        """
+        with self._condition:
+            if self.spill_path is None:
+                return
+            self.evict()
+            if self._spill_file is not None:
+                self._spill_file.flush()
+
+    def evict(self):
+        """
+        Release the bytes kept in memory. They are moved to the spill file,
+        if any, or dropped otherwise.
+        """
+        with self._condition:
+            if self._buffer:
+                self._spill(self._buffer)
+                self._buffer_offset += len(self._buffer)
+                self._buffer = bytearray()
+
+    def close(self):
+        """Finish this log and remove its spill file, if any."""
+        self.finish()
+        with self._condition:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+            if self.spill_path is not None:
+                self.spill_path.unlink(missing_ok=True)
+
+    def read(
+        self, offset: int = 0, limit: int = DEFAULT_READ_LIMIT
+    ) -> tuple[int, bytes]:
+        """
+        Read at most `limit` bytes starting at byte `offset`.
+
+        If the bytes at `offset` are neither in memory nor spilled to disk,
+        reading starts at the oldest available byte. Bytes read from the
+        spill file are continued by the bytes kept in memory, so that
+        chunks only end at `limit` or at the end of the log.
+
+        Returns:
+            A tuple comprising the actual offset and the bytes read.
+        """
+        with self._condition:
+            offset = max(0, min(offset, self.size))
+            if offset < self._buffer_offset:
+                if self._spill_file is None:
+                    offset = self._buffer_offset
+                else:
+                    self._spill_file.flush()
+                    end = min(self._buffer_offset, offset + limit)
+                    with open(self._spill_file.name, "rb") as f:
+                        f.seek(offset)
+                        data = f.read(end - offset)
+                    return offset, data + self._buffer[: limit - len(data)]
+            start = offset - self._buffer_offset
+            return offset, bytes(self._buffer[start : start + limit])
+
+    def wait(self, offset: int, timeout: float) -> bool:
+        """
+        Wait until bytes beyond `offset` are available or the log is finished.
+
+        Returns:
+            `True` if new bytes are available, `False` otherwise.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.size > offset or self._finished, timeout=timeout
+            )
+            return self.size > offset
+
+    def _spill(self, data: bytearray):
+        if self.spill_path is None:
+            return
+        if self._spill_file is None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            # Job IDs may be reused after a restart, so never append
+            # to the spill file of a previous job with the same ID
+            self._spill_file = open(self.spill_path, "wb")
+        self._spill_file.write(data)
+
+
+def trim_to_char_boundary(data: bytes) -> bytes:
+    """
+    Remove a trailing incomplete UTF-8 character from `data`, if any,
+    so that a chunk cut at a byte limit can be decoded without errors.
+    """
+    # The lead byte of the last character is at most 4 bytes from the end
+    for i in range(1, min(4, len(data)) + 1):
+        byte = data[-i]
+        if byte & 0xC0 != 0x80:
+            # ASCII or lead byte, 0b110xxxxx, 0b1110xxxx, or 0b11110xxx
+            length = 1 if byte < 0x80 else 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return data if length <= i else data[:-i]
+    return data
+
+
+class JobLogStore:
+    """
+    The logs of all jobs of a service.
+
+    Args:
+        max_memory_size: Maximum number of bytes kept in memory per job.
+        spill_dir: Optional directory that receives the bytes evicted
+            from memory, one file per job.
+        max_finished_logs: Maximum number of logs of finished jobs kept
+            in memory if there is no spill directory. The bytes of the
+            least recently finished ones are dropped.
+    """
+
+    def __init__(
+        self,
+        max_memory_size: int = DEFAULT_MAX_MEMORY_SIZE,
+        spill_dir: Optional[Path | str] = None,
+        max_finished_logs: int = DEFAULT_MAX_FINISHED_LOGS,
+    ):
+        self.max_memory_size = max_memory_size
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.max_finished_logs = max_finished_logs
+        self._logs: dict[str, JobLog] = {}
+        # IDs of finished jobs whose logs are kept in memory, oldest first
+        self._finished_ids: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    def get(self, job_id: str) -> Optional[JobLog]:
+        return self._logs.get(job_id)
+
+    def get_or_create(self, job_id: str) -> JobLog:
+        job_log = self._logs.get(job_id)
+        if job_log is None:
+            with self._lock:
+                job_log = self._logs.get(job_id)
+                if job_log is None:
+                    job_log = JobLog(
+                        max_memory_size=self.max_memory_size,
+                        spill_path=(
+                            self.spill_dir / f"{job_id}.log"
+                            if self.spill_dir is not None
+                            else None
+                        ),
+                    )
+                    self._logs[job_id] = job_log
+        return job_log
+
+    def finish(self, job_id: str):
+        job_log = self.get_or_create(job_id)
+        job_log.finish()
+        if job_log.spill_path is not None:
+            return
+        with self._lock:
+            self._finished_ids.append(job_id)
+            evicted_logs = []
+            while len(self._finished_ids) > self.max_finished_logs:
+                evicted_log = self._logs.get(self._finished_ids.popleft())
+                if evicted_log is not None:
+                    evicted_logs.append(evicted_log)
+        for evicted_log in evicted_logs:
+            evicted_log.evict()
+
+    def flush(self):
+        """Move the logs kept in memory to their spill files, if any."""
+        with self._lock:
+            job_logs = list(self._logs.values())
+        for job_log in job_logs:
+            job_log.flush()
+
+    def remove(self, job_id: str):
+        with self._lock:
+            job_log = self._logs.pop(job_id, None)
+        if job_log is not None:
+            job_log.close()
+
+
+class _JobOutputStream:
+    """Tees writes from within a job to the job's log."""
+
+    def __init__(self, stream: TextIO, store: JobLogStore):
+        self.stream = stream
+        self.store = store
+
+    def write(self, text: str) -> int:
+        job_id = get_current_job_id()
+        if job_id is not None:
+            self.store.get_or_create(job_id).write(text)
+        return self.stream.write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+def install_log_capture(store: JobLogStore):
+    """
+    Capture the output of jobs written to `sys.stdout` and `sys.stderr`
+    into the given store. The output is still written to the original
+    streams, too.
+
+    Capturing only works for jobs bound to their thread by
+    [bind_job()][s2gos_server.services.jobs.bind_job], e.g., the jobs
+    of the local service that run in threads.
+    """
+    for name in ("stdout", "stderr"):
+        stream = getattr(sys, name)
+        if isinstance(stream, _JobOutputStream):
+            stream.store = store
+        else:
+            setattr(sys, name, _JobOutputStream(stream, store))
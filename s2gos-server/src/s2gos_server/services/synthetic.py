@@ -0,0 +1,219 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Synthetic process catalogue for load testing.
+
+The service provides a configurable number of generated processes
+`synthetic_000`, `synthetic_001`, ... Each process waits, burns CPU,
+allocates memory, and returns an output of a given size, according to
+its [SyntheticProfile][s2gos_server.services.synthetic.SyntheticProfile].
+The profiles of the generated processes vary randomly around the
+configured one, so the catalogue mixes fast and slow processes.
+
+Run it using, e.g.,
+
+    s2gos-server run -- s2gos_server.services.synthetic:service \\
+        --num-processes=50 --latency=2.0 --cpu-time=0.1
+
+and drive load against it using `python -m tools.load_test`.
+"""
+
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Annotated, Any, Callable, Optional
+
+from procodile import JobContext, ProcessRegistry
+from pydantic import Field
+
+from s2gos_server.services.local import S2GOSLocalService
+
+DEFAULT_NUM_PROCESSES = 10
+
+CONFIG_ENV_VAR = "S2GOS_SYNTHETIC_CONFIG"
+"""Environment variable that passes the configuration to worker processes."""
+
+
+@dataclass(frozen=True)
+class SyntheticProfile:
+    """The resource usage of a synthetic process."""
+
+    latency: float = 0.5
+    """Seconds the process waits, e.g., for I/O."""
+    cpu_time: float = 0.0
+    """Seconds of CPU time the process consumes."""
+    memory_size: int = 0
+    """Number of bytes the process allocates while running."""
+    output_size: int = 64
+    """Number of bytes of the process output."""
+    spread: float = 0.5
+    """Relative variation of the profiles of generated processes."""
+    seed: int = 0
+    """Seed for the variation of generated processes."""
+
+
+def create_synthetic_registry(
+    num_processes: int = DEFAULT_NUM_PROCESSES,
+    profile: Optional[SyntheticProfile] = None,
+) -> ProcessRegistry:
+    """
+    Create a registry with `num_processes` synthetic processes.
+
+    Args:
+        num_processes: The number of processes.
+        profile: The profile the processes' profiles vary around.
+            Defaults to a `SyntheticProfile()`.
+
+    Returns:
+        A new process registry.
+    """
+    profile = profile or SyntheticProfile()
+    rng = random.Random(profile.seed)
+
+    def vary(value: float) -> float:
+        factor = 1.0 + profile.spread * (2.0 * rng.random() - 1.0)
+        return value * max(0.0, factor)
+
+    registry = ProcessRegistry()
+    for index in range(num_processes):
+        process_profile = replace(
+            profile,
+            latency=vary(profile.latency),
+            cpu_time=vary(profile.cpu_time),
+            memory_size=round(vary(profile.memory_size)),
+            output_size=round(vary(profile.output_size)),
+        )
+        registry.process(
+            id=f"synthetic_{index:03d}",
+            title=f"Synthetic process #{index}",
+            description=(
+                f"Waits {process_profile.latency:.2f} s, consumes"
+                f" {process_profile.cpu_time:.2f} s CPU, allocates"
+                f" {process_profile.memory_size} bytes, and returns"
+                f" {process_profile.output_size} bytes by default."
+            ),
+        )(_new_synthetic_function(process_profile))
+    return registry
+
+
+def _new_synthetic_function(profile: SyntheticProfile) -> Callable[..., str]:
+    # Annotations are evaluated here, so every process gets its own defaults
+    def run_synthetic(
+        latency: Annotated[
+            float, Field(ge=0.0, title="Latency", description="Seconds to wait")
+        ] = profile.latency,
+        cpu_time: Annotated[
+            float, Field(ge=0.0, title="CPU time", description="Seconds of CPU time")
+        ] = profile.cpu_time,
+        memory_size: Annotated[
+            int, Field(ge=0, title="Memory size", description="Bytes to allocate")
+        ] = profile.memory_size,
+        output_size: Annotated[
+            int, Field(ge=0, title="Output size", description="Bytes to return")
+        ] = profile.output_size,
+    ) -> str:
+        ctx = JobContext.get()
+        memory = bytearray(memory_size)
+        # Touch every page, so the memory is actually committed
+        for i in range(0, memory_size, 4096):
+            memory[i] = 1
+        ctx.report_progress(message="Computing...", progress=0)
+        _burn_cpu(cpu_time)
+        ctx.report_progress(message="Waiting...", progress=50)
+        time.sleep(latency)
+        del memory
+        return "x" * output_size
+
+    return run_synthetic
+
+
+def _burn_cpu(cpu_time: float):
+    end = time.thread_time() + cpu_time
+    x = 0
+    while time.thread_time() < end:
+        for i in range(1000):
+            x += i * i
+
+
+class SyntheticService(S2GOSLocalService):
+    """
+    A local service with a configurable catalogue of synthetic processes.
+
+    The configuration is also stored in the environment variable
+    `S2GOS_SYNTHETIC_CONFIG`, from which worker processes, used if
+    `processes` is set, create the same catalogue.
+    """
+
+    def __init__(self, title: str, description: Optional[str] = None):
+        config = json.loads(os.environ.get(CONFIG_ENV_VAR) or "{}")
+        self.num_processes: int = config.pop("num_processes", DEFAULT_NUM_PROCESSES)
+        self.profile = SyntheticProfile(**config)
+        super().__init__(
+            title=title,
+            description=description,
+            process_registry=create_synthetic_registry(
+                self.num_processes, self.profile
+            ),
+        )
+
+    def configure(
+        self,
+        *args: Any,
+        num_processes: Optional[int] = None,
+        latency: Optional[float] = None,
+        cpu_time: Optional[float] = None,
+        memory_size: Optional[int] = None,
+        output_size: Optional[int] = None,
+        spread: Optional[float] = None,
+        seed: Optional[int] = None,
+        **kwargs: Any,
+    ):
+        """
+        Configure the synthetic service.
+
+        Args:
+            num_processes: The number of processes. Defaults to 10.
+            latency: Seconds a process waits. Defaults to 0.5.
+            cpu_time: Seconds of CPU time a process consumes. Defaults to 0.
+            memory_size: Bytes a process allocates. Defaults to 0.
+            output_size: Bytes of a process output. Defaults to 64.
+            spread: Relative variation of the process profiles. Defaults to 0.5.
+            seed: Seed for the variation of the process profiles. Defaults to 0.
+            args: Positional options of
+                [S2GOSLocalService][s2gos_server.services.local.S2GOSLocalService].
+            kwargs: Options of
+                [S2GOSLocalService][s2gos_server.services.local.S2GOSLocalService].
+        """
+        changes: dict[str, Any] = {
+            k: v
+            for k, v in dict(
+                latency=latency,
+                cpu_time=cpu_time,
+                memory_size=memory_size,
+                output_size=output_size,
+                spread=spread,
+                seed=seed,
+            ).items()
+            if v is not None
+        }
+        profile = replace(self.profile, **changes)
+        num_processes = (
+            num_processes if num_processes is not None else self.num_processes
+        )
+        if profile != self.profile or num_processes != self.num_processes:
+            self.profile = profile
+            self.num_processes = num_processes
+            self.process_registry = create_synthetic_registry(num_processes, profile)
+        os.environ[CONFIG_ENV_VAR] = json.dumps(
+            dict(num_processes=num_processes, **asdict(profile))
+        )
+        super().configure(*args, **kwargs)
+
+
+service = SyntheticService(
+    title="S2GOS Synthetic Service",
+    description="Local S2GOS process server with synthetic processes for load testing",
+)
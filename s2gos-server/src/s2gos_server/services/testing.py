@@ -20,9 +20,11 @@ from typing import Annotated
 from gavicore.models import InputDescription, Schema
 from procodile import JobContext
 from pydantic import Field
-from wraptile.services.local import LocalService
 
-service = LocalService(
+from s2gos_server.services.estimates import job_stage
+from s2gos_server.services.local import S2GOSLocalService
+
+service = S2GOSLocalService(
     title="S2GOS Test-Server",
     description="Local DTE-S2GOS process server for testing",
 )
@@ -131,7 +133,12 @@ def mtr_demo_generation(
     print("=" * 60)
     ctx.report_progress(message="Running scene generation pipeline...")
 
-    scene_path = generation_from_config(scene_name or "scene.yaml")
+    with job_stage("generation"):
+        scene_path = generation_from_config(scene_name or "scene.yaml")
+        scene = generate_scene(scene_path, month, random_seed)
+    # Hand over the loaded scene to simulations run by the same worker,
+    # so they don't need to read it back from storage
+    service.artifacts.put(scene_path, scene, persist=save_scene)
     ctx.report_progress(
         message=f"Scene description: {scene_path}",
         progress=100,
@@ -264,8 +271,13 @@ def mtr_demo_simulation(
 
     ctx.report_progress(message="Running simulation...")
 
+    with job_stage("scene_loading"):
+        scene = service.artifacts.get_or_load(scene_name, load_scene)
+    print(f"Scene: {scene['path']} ({scene['size_km']} km)")
+
     # TODO
-    output_path = simulation_from_config(scene_name)
+    with job_stage("simulation"):
+        output_path = simulation_from_config(scene_name)
 
     if output_path:
         print("\n" + "=" * 60)
@@ -285,3 +297,22 @@ def generation_from_config(scene_name: str) -> str:
 
 def simulation_from_config(sim_name: str):
     return f"/outputs/simulations/{sim_name}"
+
+
+def generate_scene(scene_path: str, month: Month, random_seed: int) -> dict:
+    return {
+        "path": scene_path,
+        "center": (PNP_LAT, PNP_LON),
+        "size_km": PNP_SIZE_KM,
+        "month": month.value,
+        "random_seed": random_seed,
+    }
+
+
+def save_scene(scene: dict):
+    """Placeholder for writing the scene description and assets to its path."""
+
+
+def load_scene(scene_path: str) -> dict:
+    """Placeholder for reading the scene description and assets from a path."""
+    return {"path": scene_path, "size_km": PNP_SIZE_KM}
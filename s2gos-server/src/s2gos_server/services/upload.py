@@ -0,0 +1,298 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Chunked, resumable uploads of process outputs to object storage.
+
+Large outputs are written through a
+[PathRefWriter][s2gos_server.services.upload.PathRefWriter], which splits
+the written bytes into parts of a fixed size and uploads them in parallel
+while keeping at most a bounded number of parts in memory:
+
+    with PathRefWriter(PathRef("s3://bucket/scene.zarr.zip", cid="s3")) as f:
+        for chunk in produce_chunks():
+            f.write(chunk)
+
+Each part's SHA-256 checksum is verified by the store, for S3 using the
+`ChecksumSHA256` of the upload, otherwise by reading the part back. Each
+uploaded part is recorded with its size and checksum in a manifest stored
+next to the parts. If a worker restarts and writes the
+same output again, parts whose checksum matches the manifest are not
+uploaded a second time. Once all parts are uploaded, they are combined
+into the target, server-side where the filesystem supports it (e.g.
+`merge()` of `s3fs`), and the parts and manifest are removed.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from s2gos_server.services.estimates import add_output_size
+from s2gos_server.services.io import PathRef
+
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+
+# S3 rejects multipart uploads with parts smaller than this, except the last one.
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+_MANIFEST_NAME = "manifest.json"
+_VERIFY_CHUNK_SIZE = 1024 * 1024
+
+
+class PathRefWriter:
+    """
+    A binary, write-only file-like object that uploads to a `PathRef`
+    in parallel parts and can resume interrupted uploads.
+
+    At most `(max_workers + 1) * part_size` bytes are held in memory:
+    `max_workers` parts being uploaded, and one part being filled or
+    waiting for upload, as `write()` blocks meanwhile.
+
+    Args:
+        path_ref: The target path.
+        part_size: The size of an uploaded part in bytes, defaults to 8 MiB.
+            Must not be smaller than 5 MiB if the target is an S3 object.
+        max_workers: The maximum number of parts uploaded concurrently,
+            defaults to 4.
+        parts_path_ref: The directory that receives the parts and the
+            manifest. Must be on the same filesystem as the target.
+            Defaults to `<target>.parts` next to the target.
+    """
+
+    def __init__(
+        self,
+        path_ref: PathRef,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        parts_path_ref: Optional[PathRef] = None,
+    ):
+        if part_size <= 0:
+            raise ValueError("part_size must be a positive integer")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer")
+        self.path_ref = path_ref
+        self.part_size = part_size
+        self.max_workers = max_workers
+        self.parts_path_ref = parts_path_ref or PathRef(
+            f"{path_ref.value}.parts", path_ref.cid
+        )
+
+        upath = path_ref.upath
+        protocols = upath.fs.protocol
+        if isinstance(protocols, str):
+            protocols = (protocols,)
+        self._is_s3 = bool({"s3", "s3a"}.intersection(protocols))
+        if part_size < MIN_PART_SIZE and self._is_s3:
+            raise ValueError(
+                f"part_size must be at least {MIN_PART_SIZE} bytes for S3 targets"
+            )
+        self._fs = upath.fs
+        self._path = upath.path
+        self._parts_path = self.parts_path_ref.upath.path
+
+        self._buffer = bytearray()
+        self._part_number = 0
+        self._manifest = self._read_manifest()
+        self._manifest_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._futures: list[Future] = []
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="s2gos-upload"
+        )
+        self.closed = False
+        self.skipped_parts = 0
+        self.size = 0
+
+    def __enter__(self) -> "PathRefWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep uploaded parts and manifest, so a retry can resume.
+            self.abort()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        """Write `data` and upload every completed part."""
+        if self.closed:
+            raise ValueError("write to closed PathRefWriter")
+        view = memoryview(data).cast("B")
+        size = len(view)
+        # Fill the buffer part by part, so it never exceeds part_size
+        while view:
+            n = min(self.part_size - len(self._buffer), len(view))
+            self._buffer.extend(view[:n])
+            view = view[n:]
+            if len(self._buffer) == self.part_size:
+                part, self._buffer = self._buffer, bytearray()
+                self._submit_part(part)
+        self.size += size
+        return size
+
+    def close(self):
+        """Upload the remaining bytes and combine all parts into the target."""
+        if self.closed:
+            return
+        if self._buffer or self._part_number == 0:
+            part, self._buffer = self._buffer, bytearray()
+            self._submit_part(part)
+        try:
+            self._wait_for_parts()
+        finally:
+            self._executor.shutdown()
+            self.closed = True
+        self._combine_parts()
+        add_output_size(self.size)
+
+    def abort(self):
+        """Stop uploading, but keep uploaded parts to resume from later."""
+        if self.closed:
+            return
+        self._buffer.clear()
+        self._executor.shutdown(cancel_futures=True)
+        self.closed = True
+
+    def _submit_part(self, data: bytes | bytearray):
+        self._part_number += 1
+        part_number = self._part_number
+        checksum = hashlib.sha256(data).hexdigest()
+        if self._is_uploaded(part_number, len(data), checksum):
+            self.skipped_parts += 1
+            return
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(
+                self._upload_part, part_number, data, checksum
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _f: self._slots.release())
+        self._futures.append(future)
+
+    def _upload_part(self, part_number: int, data: bytes | bytearray, checksum: str):
+        part_path = self._part_path(part_number)
+        if self._is_s3:
+            # S3 verifies the checksum and rejects the part on mismatch
+            self._fs.pipe_file(
+                part_path,
+                data,
+                ChecksumSHA256=base64.b64encode(bytes.fromhex(checksum)).decode(),
+            )
+        else:
+            self._fs.pipe_file(part_path, data)
+            self._verify_part(part_path, checksum)
+        with self._manifest_lock:
+            self._manifest["parts"][str(part_number)] = {
+                "size": len(data),
+                "sha256": checksum,
+            }
+            self._write_manifest()
+
+    def _verify_part(self, part_path: str, checksum: str):
+        sha256 = hashlib.sha256()
+        with self._fs.open(part_path, "rb") as f:
+            while chunk := f.read(_VERIFY_CHUNK_SIZE):
+                sha256.update(chunk)
+        if sha256.hexdigest() != checksum:
+            self._fs.rm(part_path)
+            raise OSError(f"Checksum mismatch of uploaded part {part_path}")
+
+    def _wait_for_parts(self):
+        futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def _is_uploaded(self, part_number: int, size: int, checksum: str) -> bool:
+        part: Optional[dict[str, Any]] = self._manifest["parts"].get(str(part_number))
+        return (
+            part is not None
+            and part["size"] == size
+            and part["sha256"] == checksum
+            and self._part_size(part_number) == size
+        )
+
+    def _part_size(self, part_number: int) -> Optional[int]:
+        try:
+            return self._fs.size(self._part_path(part_number))
+        except FileNotFoundError:
+            return None
+
+    def _combine_parts(self):
+        part_paths = [self._part_path(n) for n in range(1, self._part_number + 1)]
+        merge = getattr(self._fs, "merge", None)
+        if merge is not None and len(part_paths) > 1:
+            merge(self._path, part_paths)
+        else:
+            with self._fs.open(self._path, "wb") as f:
+                for part_path in part_paths:
+                    with self._fs.open(part_path, "rb") as part:
+                        _copy_stream(part, f, self.part_size)
+        self._fs.rm(self._parts_path, recursive=True)
+
+    def _part_path(self, part_number: int) -> str:
+        return f"{self._parts_path}/part-{part_number:05d}"
+
+    def _manifest_path(self) -> str:
+        return f"{self._parts_path}/{_MANIFEST_NAME}"
+
+    def _read_manifest(self) -> dict[str, Any]:
+        manifest_path = self._manifest_path()
+        if self._fs.exists(manifest_path):
+            manifest = json.loads(self._fs.cat_file(manifest_path))
+            if (
+                manifest.get("target") == self.path_ref.value
+                and manifest.get("part_size") == self.part_size
+            ):
+                return manifest
+        return {"target": self.path_ref.value, "part_size": self.part_size, "parts": {}}
+
+    def _write_manifest(self):
+        self._fs.pipe_file(
+            self._manifest_path(), json.dumps(self._manifest).encode("utf-8")
+        )
+
+
+def upload_file(
+    local_path: str | Path,
+    path_ref: PathRef,
+    part_size: int = DEFAULT_PART_SIZE,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> PathRef:
+    """
+    Upload a local file to `path_ref` using a
+    [PathRefWriter][s2gos_server.services.upload.PathRefWriter].
+
+    Calling this function again after an interrupted upload only uploads
+    the parts that are missing.
+
+    Args:
+        local_path: The local file to upload.
+        path_ref: The target path.
+        part_size: The size of an uploaded part in bytes, defaults to 8 MiB.
+        max_workers: The maximum number of parts uploaded concurrently,
+            defaults to 4.
+
+    Returns:
+        The given `path_ref`.
+    """
+    with open(local_path, "rb") as f:
+        with PathRefWriter(
+            path_ref, part_size=part_size, max_workers=max_workers
+        ) as writer:
+            _copy_stream(f, writer, part_size)
+    return path_ref
+
+
+def _copy_stream(source: BinaryIO, target: Any, chunk_size: int):
+    while chunk := source.read(chunk_size):
+        target.write(chunk)
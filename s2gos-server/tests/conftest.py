@@ -0,0 +1,41 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import sys
+from collections.abc import Callable, Iterator
+
+import pytest
+from fastapi.testclient import TestClient
+from gavicore.service import Service
+from wraptile.main import app
+from wraptile.provider import ServiceProvider
+
+from s2gos_server.routes import include_s2gos_routes
+
+
+@pytest.fixture(autouse=True)
+def restore_stdio() -> Iterator[None]:
+    """
+    Restore `sys.stdout` and `sys.stderr`, which local services
+    replace to capture the output of their jobs.
+    """
+    stdout, stderr = sys.stdout, sys.stderr
+    yield
+    sys.stdout, sys.stderr = stdout, stderr
+
+
+@pytest.fixture
+def use_service() -> Iterator[Callable[[Service], TestClient]]:
+    """
+    Provide a function that lets the app use the given service
+    and returns a test client of the app.
+    """
+
+    def use(service: Service) -> TestClient:
+        include_s2gos_routes(app)
+        ServiceProvider.set_instance(service)
+        return TestClient(app)
+
+    yield use
+    ServiceProvider._service = None
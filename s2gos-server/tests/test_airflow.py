@@ -0,0 +1,291 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import datetime
+import json
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+pytest.importorskip("airflow_client")
+
+from airflow_client.client import ApiException, DagRunState  # noqa: E402
+from gavicore.models import JobStatus, Link  # noqa: E402
+
+from s2gos_server.services.airflow import S2GOSAirflowService  # noqa: E402
+
+NOW = datetime.datetime(2026, 1, 21, 12, tzinfo=datetime.timezone.utc)
+
+
+def new_dag_run(dag_id: str, index: int, state: DagRunState):
+    return SimpleNamespace(
+        dag_id=dag_id,
+        dag_run_id=f"{dag_id}__20260121120000_{index}",
+        state=state,
+        note=None,
+        queued_at=NOW,
+        start_date=NOW,
+        last_scheduling_decision=NOW,
+        end_date=None,
+    )
+
+
+class FakeDagRunApi:
+    """A local stand-in for Airflow's DAG-run REST API."""
+
+    def __init__(self, dag_runs):
+        self.dag_runs = list(dag_runs)
+        self.calls = []
+        self.fail = False
+
+    def get_dag_runs(self, dag_id, limit=None, offset=None, **kwargs):
+        self.calls.append(dict(dag_id=dag_id, limit=limit, offset=offset, **kwargs))
+        if self.fail:
+            raise ApiException(status=503, reason="Service Unavailable")
+        offset = offset or 0
+        page = self.dag_runs[offset : offset + limit]
+        return SimpleNamespace(dag_runs=page, total_entries=len(self.dag_runs))
+
+    def get_dag_run(self, dag_id, dag_run_id):
+        self.calls.append(dict(dag_id=dag_id, dag_run_id=dag_run_id))
+        return next(r for r in self.dag_runs if r.dag_run_id == dag_run_id)
+
+
+def new_service(fake_api: FakeDagRunApi, **config) -> S2GOSAirflowService:
+    service = S2GOSAirflowService(title="Test")
+    service.configure(**config)
+    patcher = patch.object(
+        S2GOSAirflowService,
+        "airflow_dag_run_api",
+        new_callable=PropertyMock,
+        return_value=fake_api,
+    )
+    patcher.start()
+    return service
+
+
+@pytest.fixture(autouse=True)
+def stop_patches():
+    yield
+    patch.stopall()
+
+
+def test_sync_jobs_fetches_all_dags_page_wise():
+    fake_api = FakeDagRunApi(
+        [new_dag_run("gen", i, DagRunState.SUCCESS) for i in range(150)]
+        + [new_dag_run("sim", i, DagRunState.RUNNING) for i in range(30)]
+    )
+    service = new_service(fake_api)
+
+    assert service.sync_jobs() == 180
+    assert [c["dag_id"] for c in fake_api.calls] == ["~", "~"]
+    assert [c["offset"] for c in fake_api.calls] == [0, 100]
+    assert fake_api.calls[0]["updated_at_gte"] is None
+    assert service.is_cache_fresh()
+
+    fake_api.calls.clear()
+    service.sync_jobs()
+    assert fake_api.calls[0]["updated_at_gte"] is not None
+
+
+def test_get_job_is_served_from_cache():
+    dag_run = new_dag_run("sim", 1, DagRunState.RUNNING)
+    fake_api = FakeDagRunApi([dag_run])
+    service = new_service(fake_api)
+
+    async def run():
+        service.sync_jobs()
+        fake_api.calls.clear()
+        job_info = await service.get_job(dag_run.dag_run_id)
+        await service.close()
+        return job_info
+
+    job_info = asyncio.run(run())
+    assert job_info.status == JobStatus.running
+    assert fake_api.calls == []
+
+
+def test_get_job_falls_back_to_airflow_if_cache_is_stale():
+    dag_run = new_dag_run("sim", 1, DagRunState.RUNNING)
+    fake_api = FakeDagRunApi([dag_run])
+    service = new_service(fake_api)
+
+    async def run():
+        service._sync_task = asyncio.get_running_loop().create_future()
+        return await service.get_job(dag_run.dag_run_id)
+
+    job_info = asyncio.run(run())
+    assert job_info.status == JobStatus.running
+    assert fake_api.calls == [dict(dag_id="sim", dag_run_id=dag_run.dag_run_id)]
+
+
+def test_sync_task_updates_cache_and_stops_on_close():
+    dag_run = new_dag_run("sim", 1, DagRunState.RUNNING)
+    fake_api = FakeDagRunApi([dag_run])
+    service = new_service(fake_api)
+
+    async def run():
+        service._ensure_sync_task()
+        sync_task = service._sync_task
+        while not service.is_cache_fresh():
+            await asyncio.sleep(0.01)
+        await service.close()
+        return sync_task
+
+    sync_task = asyncio.run(run())
+    assert sync_task.cancelled()
+    assert service._sync_task is None
+    assert list(service._job_cache) == [dag_run.dag_run_id]
+
+
+def test_sync_backs_off_while_airflow_fails():
+    fake_api = FakeDagRunApi([new_dag_run("sim", 1, DagRunState.QUEUED)])
+    service = new_service(fake_api, sync_interval=1, max_sync_interval=3)
+
+    async def run():
+        fake_api.fail = True
+        await service._sync_once()
+        assert service._current_sync_interval == 2
+        await service._sync_once()
+        assert service._current_sync_interval == 3
+        fake_api.fail = False
+        await service._sync_once()
+        assert service._current_sync_interval == 1
+
+    asyncio.run(run())
+
+
+def test_job_cache_is_bounded():
+    fake_api = FakeDagRunApi(
+        [new_dag_run("gen", i, DagRunState.SUCCESS) for i in range(150)]
+    )
+    service = new_service(fake_api, max_cached_jobs=120)
+
+    assert service.sync_jobs() == 150
+    assert len(service._job_cache) == 120
+
+
+def test_get_jobs_returns_one_page_per_process():
+    fake_api = FakeDagRunApi(
+        [new_dag_run("gen", i, DagRunState.SUCCESS) for i in range(80)]
+        + [new_dag_run("sim", i, DagRunState.RUNNING) for i in range(3)]
+    )
+    service = new_service(fake_api)
+    request = SimpleNamespace()
+
+    async def run():
+        service.sync_jobs()
+        service._sync_task = asyncio.get_running_loop().create_future()
+        return await service.get_jobs(request)
+
+    with patch.object(
+        S2GOSAirflowService, "get_self_link", return_value=Link(href="/jobs")
+    ):
+        job_list = asyncio.run(run())
+    job_ids = [j.jobID for j in job_list.jobs]
+    assert len(job_ids) == 53
+    assert sum(job_id.startswith("gen__") for job_id in job_ids) == 50
+
+
+def test_cache_is_not_fresh_while_backing_off():
+    fake_api = FakeDagRunApi([new_dag_run("sim", 1, DagRunState.QUEUED)])
+    service = new_service(fake_api, sync_interval=1, max_sync_interval=60)
+    service.sync_jobs()
+    service._current_sync_interval = 60
+    service._last_sync_time -= 30
+
+    assert not service.is_cache_fresh()
+
+
+class FakeAirflowHandler(BaseHTTPRequestHandler):
+    """A local stand-in for Airflow's token and DAG-run HTTP endpoints."""
+
+    protocol_version = "HTTP/1.1"
+    dag_runs: list[dict] = []
+    requests: list[tuple[str, str, Optional[str], int]] = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._record()
+        self._send_json({"access_token": "airflow-token"})
+
+    def do_GET(self):
+        self._record()
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        self._send_json(
+            {
+                "dag_runs": self.dag_runs[offset : offset + limit],
+                "total_entries": len(self.dag_runs),
+            }
+        )
+
+    def _record(self):
+        self.requests.append(
+            (
+                self.command,
+                urllib.parse.urlparse(self.path).path,
+                self.headers.get("Authorization"),
+                self.client_address[1],
+            )
+        )
+
+    def _send_json(self, data):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sync_jobs_uses_pooled_airflow_session():
+    FakeAirflowHandler.dag_runs = [
+        {
+            "dag_id": "gen",
+            "dag_run_id": f"gen__20260121120000_{i}",
+            "dag_versions": [],
+            "queued_at": NOW.isoformat(),
+            "run_after": NOW.isoformat(),
+            "run_type": "manual",
+            "state": "success",
+        }
+        for i in range(150)
+    ]
+    FakeAirflowHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAirflowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        service = S2GOSAirflowService(title="Test")
+        service.configure(
+            airflow_base_url=f"http://127.0.0.1:{server.server_port}",
+            airflow_username="admin",
+            airflow_password="secret",
+            pool_maxsize=2,
+        )
+
+        assert service.sync_jobs() == 150
+        assert service.airflow_client.configuration.connection_pool_maxsize == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    dag_run_requests = [r for r in FakeAirflowHandler.requests if r[0] == "GET"]
+    assert [r[1] for r in dag_run_requests] == ["/api/v2/dags/~/dagRuns"] * 2
+    assert {r[2] for r in dag_run_requests} == {"Bearer airflow-token"}
+    # Both pages were fetched over the same pooled connection
+    assert len({r[3] for r in dag_run_requests}) == 1
+    assert service._job_cache["gen__20260121120000_0"].status == JobStatus.successful
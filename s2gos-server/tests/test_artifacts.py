@@ -0,0 +1,155 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from gavicore.models import JobStatus, ProcessRequest
+
+from s2gos_server.services.artifacts import ArtifactCache, get_size
+
+
+def test_get_size():
+    assert get_size(b"x" * 1000) >= 1000
+    assert get_size({"a": [b"x" * 1000, b"y" * 1000]}) >= 2000
+    assert get_size(type("Array", (), {"nbytes": 42})()) == 42
+
+
+def test_get_size_counts_shared_and_cyclic_values_once():
+    data = b"x" * 1000
+    shared = [data, data]
+    assert get_size(shared) == sys.getsizeof(shared) + sys.getsizeof(data)
+
+    cycle: list = [data]
+    cycle.append(cycle)
+    assert get_size(cycle) == sys.getsizeof(cycle) + sys.getsizeof(data)
+
+    nested: list = []
+    for _ in range(10 * sys.getrecursionlimit()):
+        nested = [nested]
+    assert get_size(nested) > 0
+
+
+def test_artifact_cache_evicts_least_recently_used():
+    cache = ArtifactCache(max_size=30)
+    cache.put("a", "A", size=10)
+    cache.put("b", "B", size=10)
+    cache.put("c", "C", size=10)
+    assert cache.get("a") == "A"
+
+    cache.put("d", "D", size=10)
+
+    assert "b" not in cache
+    assert [cache.get(k) for k in "acd"] == ["A", "C", "D"]
+    assert cache.size == 30
+
+    cache.put("e", "E", size=31)
+    assert "e" not in cache
+    assert len(cache) == 3
+
+
+def test_artifact_cache_get_or_load_loads_once():
+    cache = ArtifactCache()
+    calls = []
+
+    def load(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return key.upper()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: cache.get_or_load("a", load), range(4)))
+
+    assert results == ["A"] * 4
+    assert calls == ["a"]
+
+
+def test_artifact_cache_get_or_load_propagates_errors():
+    cache = ArtifactCache()
+
+    def load(key):
+        raise OSError(f"cannot read {key}")
+
+    with pytest.raises(OSError, match="cannot read a"):
+        cache.get_or_load("a", load)
+    assert cache.get_or_load("a", str.upper) == "A"
+
+
+def test_artifact_cache_persists_in_background():
+    cache = ArtifactCache()
+    persisted = []
+    release = threading.Event()
+
+    def persist(value):
+        release.wait(5)
+        persisted.append(value)
+
+    future = cache.put("a", "A", persist=persist)
+    assert future is not None
+    assert cache.get("a") == "A"
+    assert cache.flush(timeout=0.01) is False
+
+    release.set()
+    assert cache.flush(timeout=5) is True
+    assert persisted == ["A"]
+
+
+def test_artifact_cache_serves_evicted_artifacts_while_persisting():
+    cache = ArtifactCache(max_size=10)
+    storage = {}
+    release = threading.Event()
+
+    def persist(value):
+        release.wait(5)
+        storage["a"] = value
+
+    cache.put("a", "A", size=10, persist=persist)
+    cache.put("b", "B", size=10)
+    assert "a" not in cache
+
+    assert cache.get("a") == "A"
+    assert cache.get_or_load("a", storage.__getitem__) == "A"
+
+    release.set()
+    assert cache.flush(timeout=5) is True
+    # Persisted, so loaded from storage now
+    for _ in range(100):
+        if cache.get("a") is None:
+            break
+        time.sleep(0.01)
+    assert cache.get("a") is None
+    assert cache.get_or_load("a", storage.__getitem__) == "A"
+
+
+def test_simulation_reuses_generated_scene(monkeypatch):
+    from s2gos_server.services import testing
+
+    loaded = []
+    monkeypatch.setattr(testing, "load_scene", lambda p: loaded.append(p) or {})
+    service = testing.service
+    service.configure()
+    for process_id, inputs in (
+        ("mtr_demo_generation", {"scene_name": "pnp.yaml"}),
+        (
+            "mtr_demo_simulation",
+            {
+                "scene_name": "/outputs/scenes/pnp.yaml",
+                "hour_utc": 14.0,
+                "observation": "msi",
+            },
+        ),
+    ):
+        job_info = asyncio.run(
+            service.execute_process(process_id, ProcessRequest(inputs=inputs))
+        )
+        job = service.jobs[job_info.jobID]
+        job.future.result()
+        assert job.job_info.status == JobStatus.successful, job.job_info
+
+    assert loaded == []
+    assert service.artifacts.flush(timeout=5)
@@ -0,0 +1,177 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import enum
+import time
+
+import pytest
+from gavicore.models import JobStatus, ProcessRequest
+from procodile import Job
+
+from s2gos_server.services.estimates import (
+    CostModel,
+    add_output_size,
+    get_features,
+    job_stage,
+    pop_job_metrics,
+)
+from s2gos_server.services.jobs import bind_job
+from s2gos_server.services.local import S2GOSLocalService
+
+
+class Observation(enum.StrEnum):
+    MSI = "msi"
+    CHIME = "chime"
+
+
+# Seconds per sample and observation type
+COST_PER_SAMPLE = {Observation.MSI: 0.5, Observation.CHIME: 2.0}
+
+
+def test_get_features():
+    features = get_features(
+        {"spp": 8, "observation": Observation.MSI, "scene_name": "pnp"}
+    )
+    assert features == {
+        "spp": 8.0,
+        "observation=msi": 1.0,
+        "spp*observation=msi": 8.0,
+    }
+
+
+def test_cost_model_without_records():
+    estimate = CostModel().estimate("sim", {"spp": 8})
+    assert estimate.sampleCount == 0
+    assert estimate.runtime is None
+    assert estimate.outputSize is None
+
+
+def test_cost_model_learns_cost_per_category():
+    model = CostModel()
+    for observation, cost in COST_PER_SAMPLE.items():
+        for spp in (4, 8, 16, 32):
+            model.record(
+                "sim",
+                {"spp": spp, "observation": observation},
+                runtime=1.0 + cost * spp,
+                stages={"simulation": cost * spp},
+                output_size=1000 * spp,
+            )
+
+    estimate = model.estimate("sim", {"spp": 64, "observation": Observation.CHIME})
+
+    assert estimate.sampleCount == 8
+    assert estimate.runtime == pytest.approx(129.0, rel=0.05)
+    assert estimate.stages["simulation"] == pytest.approx(128.0, rel=0.05)
+    assert estimate.outputSize == pytest.approx(64000, rel=0.05)
+    assert model.estimate(
+        "sim", {"spp": 64, "observation": Observation.MSI}
+    ).runtime == pytest.approx(33.0, rel=0.05)
+
+
+def test_cost_model_persists_records(tmp_path):
+    records_path = tmp_path / "costs.jsonl"
+    model = CostModel(records_path=records_path, max_records=2)
+    for runtime in (1.0, 2.0, 3.0):
+        model.record("sim", {}, runtime=runtime)
+
+    model = CostModel(records_path=records_path, max_records=2)
+    estimate = model.estimate("sim", {})
+    assert estimate.sampleCount == 2
+    assert estimate.runtime == pytest.approx(2.5)
+
+
+class FakeJob:
+    job_info = type("JobInfo", (), {"jobID": "job_3"})()
+
+    def run(self):
+        with bind_job(self):
+            with job_stage("simulation"):
+                time.sleep(0.01)
+            add_output_size(100)
+            add_output_size(20)
+
+
+def test_job_metrics():
+    with job_stage("not_in_job"):
+        add_output_size(1)
+    FakeJob().run()
+
+    metrics = pop_job_metrics("job_3")
+    assert list(metrics.stages) == ["simulation"]
+    assert metrics.stages["simulation"] >= 0.01
+    assert metrics.output_size == 120
+    assert pop_job_metrics("job_3").stages == {}
+
+
+def test_local_service_estimate_endpoint(use_service):
+    service = S2GOSLocalService(title="Test")
+
+    @service.process_registry.process(id="render")
+    def render(spp: int = 8) -> int:
+        with job_stage("render"):
+            time.sleep(0.001 * spp)
+        return spp
+
+    service.configure()
+    client = use_service(service)
+    response = client.post("/processes/render/estimate", json={"inputs": {}})
+    assert response.status_code == 200
+    assert response.json() == {
+        "processID": "render",
+        "runtime": None,
+        "stages": {},
+        "outputSize": None,
+        "sampleCount": 0,
+    }
+
+    response = client.post("/processes/render/execution", json={"inputs": {"spp": 10}})
+    assert response.status_code == 201
+    service.jobs[response.json()["jobID"]].future.result()
+
+    # The job's cost is recorded by a done-callback of its future,
+    # which may run after result() returned
+    for _ in range(100):
+        response = client.post(
+            "/processes/render/estimate", json={"inputs": {"spp": 10}}
+        )
+        assert response.status_code == 200
+        estimate = response.json()
+        if estimate["sampleCount"]:
+            break
+        time.sleep(0.01)
+    assert estimate["sampleCount"] == 1
+    assert estimate["runtime"] > 0
+    assert list(estimate["stages"]) == ["render"]
+
+    service.configure(max_estimated_runtime=0.0)
+    response = client.post("/processes/render/execution", json={"inputs": {"spp": 10}})
+    assert response.status_code == 400
+    assert "exceeds the limit" in response.json()["detail"]
+
+    response = client.post(
+        "/processes/render/estimate", json={"inputs": {"spp": "many"}}
+    )
+    assert response.status_code == 400
+
+
+def test_local_service_does_not_record_jobs_run_in_processes():
+    service = S2GOSLocalService(title="Test")
+
+    @service.process_registry.process(id="render")
+    def render(spp: int = 8) -> int:
+        return spp
+
+    job = Job.create(
+        service.process_registry.get("render"),
+        ProcessRequest(inputs={"spp": 10}),
+        job_id="job_0",
+    )
+    job.run()
+    service.job_uses_processes["job_0"] = True
+
+    service._on_job_done("render", job)
+
+    assert job.job_info.status == JobStatus.successful
+    assert service.cost_model.estimate("render", {"spp": 10}).sampleCount == 0
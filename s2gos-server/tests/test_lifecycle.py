@@ -0,0 +1,221 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import json
+import signal
+import threading
+
+import fastapi
+import pytest
+from fastapi.testclient import TestClient
+from gavicore.models import JobStatus, ProcessRequest
+from wraptile.exceptions import ServiceException
+
+from s2gos_server import lifecycle
+from s2gos_server.services.local import S2GOSLocalService
+from s2gos_server.services.logs import JobLog
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = S2GOSLocalService(title="Test")
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    @service.process_registry.process(id="block")
+    def block(timeout: float = 5.0) -> bool:
+        started.release()
+        return release.wait(timeout)
+
+    service.release = release
+    service.started = started
+    service.configure(max_workers=1, checkpoint_path=str(tmp_path / "checkpoint.json"))
+    try:
+        yield service
+    finally:
+        release.set()
+        service.executor.shutdown(wait=True)
+
+
+def execute(service, **inputs):
+    return asyncio.run(service.execute_process("block", ProcessRequest(inputs=inputs)))
+
+
+def test_drain_checkpoints_unfinished_jobs(service, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    running = execute(service)
+    assert service.started.acquire(timeout=5)
+    queued = execute(service, timeout=1.0)
+
+    service.drain(timeout=0.05)
+
+    assert service.draining is True
+    assert service.jobs[queued.jobID].job_info.status == JobStatus.dismissed
+    checkpoint = json.loads(checkpoint_path.read_text())
+    assert checkpoint == {
+        "jobs": [
+            {"jobID": running.jobID, "processID": "block", "request": {"inputs": {}}},
+            {
+                "jobID": queued.jobID,
+                "processID": "block",
+                "request": {"inputs": {"timeout": 1.0}},
+            },
+        ]
+    }
+    with pytest.raises(ServiceException) as e:
+        execute(service)
+    assert e.value.status_code == 503
+
+
+def test_drain_waits_for_running_jobs(service, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    job_info = execute(service)
+    assert service.started.acquire(timeout=5)
+    threading.Timer(0.05, service.release.set).start()
+
+    service.drain(timeout=5)
+
+    assert service.jobs[job_info.jobID].job_info.status == JobStatus.successful
+    assert not checkpoint_path.exists()
+
+
+def test_job_ids_are_unique_across_restarts(service):
+    job_ids = {execute(service, timeout=0.0).jobID for _ in range(3)}
+
+    restarted = S2GOSLocalService(title="Test")
+    restarted.process_registry = service.process_registry
+    try:
+        job_ids.add(
+            asyncio.run(
+                restarted.execute_process(
+                    "block", ProcessRequest(inputs={"timeout": 0.0})
+                )
+            ).jobID
+        )
+    finally:
+        restarted.executor.shutdown(wait=True)
+
+    assert len(job_ids) == 4
+
+
+def test_resume_jobs(service, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(
+        json.dumps(
+            {
+                "jobs": [
+                    {
+                        "jobID": "job_3",
+                        "processID": "block",
+                        "request": {"inputs": {"timeout": 0.0}},
+                    }
+                ]
+            }
+        )
+    )
+
+    job_infos = asyncio.run(service.resume_jobs())
+
+    assert [job_info.jobID for job_info in job_infos] == ["job_3"]
+    job = service.jobs["job_3"]
+    job.future.result(timeout=5)
+    assert job.job_info.status == JobStatus.successful
+    assert not checkpoint_path.exists()
+    assert asyncio.run(service.resume_jobs()) == []
+
+
+def test_job_log_flush(tmp_path):
+    spill_path = tmp_path / "job_0.log"
+    job_log = JobLog(spill_path=spill_path)
+    job_log.write("line 1\n")
+
+    job_log.flush()
+
+    assert spill_path.read_bytes() == b"line 1\n"
+    assert job_log.read(0) == (0, b"line 1\n")
+    job_log.write("line 2\n")
+    assert job_log.read(7) == (7, b"line 2\n")
+
+
+def test_health_endpoints(service, use_service):
+    client = use_service(service)
+    response = client.get("/health/live")
+    assert (response.status_code, response.json()) == (200, {"status": "alive"})
+    response = client.get("/health/ready")
+    assert (response.status_code, response.json()) == (200, {"status": "ready"})
+
+    service.drain(timeout=0)
+
+    response = client.get("/health/ready")
+    assert (response.status_code, response.json()) == (503, {"status": "draining"})
+    response = client.post("/processes/block/execution", json={"inputs": {}})
+    assert response.status_code == 503
+
+
+def test_lifespan_resumes_jobs(service, use_service, tmp_path):
+    (tmp_path / "checkpoint.json").write_text(
+        json.dumps(
+            {
+                "jobs": [
+                    {
+                        "jobID": "job_0",
+                        "processID": "block",
+                        "request": {"inputs": {"timeout": 0.0}},
+                    }
+                ]
+            }
+        )
+    )
+    app_ = fastapi.FastAPI()
+    lifecycle.install_lifecycle(app_)
+    lifecycle.install_lifecycle(app_)
+    use_service(service)
+    with TestClient(app_):
+        assert list(service.jobs) == ["job_0"]
+
+    assert not (tmp_path / "checkpoint.json").exists()
+    (job,) = service.jobs.values()
+    job.future.result(timeout=5)
+    assert job.job_info.status == JobStatus.successful
+
+
+def test_lifespan_closes_service(service, use_service):
+    closed = threading.Event()
+
+    async def close():
+        closed.set()
+
+    service.close = close
+    app_ = fastapi.FastAPI()
+    lifecycle.install_lifecycle(app_)
+    use_service(service)
+    with TestClient(app_):
+        assert not closed.is_set()
+
+    assert closed.is_set()
+
+
+def test_sigterm_drains_service(service, tmp_path):
+    service.drain_timeout = 0.05
+    job_info = execute(service)
+    assert service.started.acquire(timeout=5)
+    shut_down = threading.Event()
+    original_handler = signal.signal(
+        signal.SIGTERM, lambda _sig, _frame: shut_down.set()
+    )
+    try:
+        lifecycle.install_sigterm_handler(service)
+
+        signal.raise_signal(signal.SIGTERM)
+
+        assert lifecycle.is_draining()
+        assert shut_down.wait(timeout=5)
+    finally:
+        signal.signal(signal.SIGTERM, original_handler)
+        lifecycle._draining.clear()
+
+    assert service.draining is True
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert [entry["jobID"] for entry in checkpoint["jobs"]] == [job_info.jobID]
@@ -0,0 +1,174 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import threading
+
+from s2gos_server.services.jobs import bind_job
+from s2gos_server.services.local import S2GOSLocalService
+from s2gos_server.services.logs import (
+    JobLog,
+    JobLogStore,
+    install_log_capture,
+    trim_to_char_boundary,
+)
+
+
+def test_job_log_reads_incrementally():
+    job_log = JobLog()
+    job_log.write("line 1\n")
+    offset, data = job_log.read(0)
+    assert (offset, data) == (0, b"line 1\n")
+
+    job_log.write("line 2\n")
+    offset, data = job_log.read(offset + len(data))
+    assert (offset, data) == (7, b"line 2\n")
+    assert job_log.read(job_log.size) == (14, b"")
+
+
+def test_job_log_ring_buffer_drops_old_bytes():
+    job_log = JobLog(max_memory_size=10)
+    job_log.write("0123456789abcdef")
+
+    assert job_log.size == 16
+    assert job_log.read(0) == (6, b"6789abcdef")
+
+
+def test_job_log_spills_to_disk(tmp_path):
+    spill_path = tmp_path / "job_0.log"
+    job_log = JobLog(max_memory_size=10, spill_path=spill_path)
+    job_log.write("0123456789abcdef")
+
+    assert job_log.read(0) == (0, b"0123456789abcdef")
+    assert job_log.read(6) == (6, b"6789abcdef")
+    assert job_log.read(2, limit=3) == (2, b"234")
+    assert job_log.read(4, limit=4) == (4, b"4567")
+
+    job_log.close()
+    assert not spill_path.exists()
+
+
+def test_job_log_reads_characters_across_spill_boundary(tmp_path):
+    job_log = JobLog(max_memory_size=4, spill_path=tmp_path / "job_0.log")
+    job_log.write("€€")
+
+    assert job_log.read(0) == (0, "€€".encode("utf-8"))
+
+
+def test_job_log_finish_moves_bytes_to_spill_file(tmp_path):
+    spill_path = tmp_path / "job_0.log"
+    job_log = JobLog(spill_path=spill_path)
+    job_log.write("done\n")
+
+    job_log.finish()
+
+    assert spill_path.read_bytes() == b"done\n"
+    assert job_log.read(0) == (0, b"done\n")
+    assert job_log.finished
+
+
+def test_job_log_store_evicts_least_recently_finished_logs():
+    store = JobLogStore(max_finished_logs=1)
+    for job_id in ("job_0", "job_1"):
+        store.get_or_create(job_id).write(f"{job_id}\n")
+        store.finish(job_id)
+
+    assert store.get("job_0").read(0) == (6, b"")
+    assert store.get("job_1").read(0) == (0, b"job_1\n")
+
+
+def test_job_log_wait():
+    job_log = JobLog()
+    assert job_log.wait(0, timeout=0.01) is False
+
+    timer = threading.Timer(0.05, job_log.write, args=("hello\n",))
+    timer.start()
+    assert job_log.wait(0, timeout=5.0) is True
+    timer.join()
+
+
+class FakeJob:
+    job_info = type("JobInfo", (), {"jobID": "job_7"})()
+
+    def run(self):
+        with bind_job(self):
+            print("from job")
+
+
+def test_install_log_capture_captures_job_output_only():
+    store = JobLogStore()
+    install_log_capture(store)
+    print("not from job")
+    FakeJob().run()
+
+    assert store.get("job_7").read(0) == (0, b"from job\n")
+
+
+def test_local_service_job_logs_endpoint(use_service):
+    service = S2GOSLocalService(title="Test")
+
+    @service.process_registry.process(id="talk")
+    def talk(count: int = 3) -> int:
+        for i in range(count):
+            print(f"line {i}")
+        return count
+
+    service.configure()
+    client = use_service(service)
+    response = client.post("/processes/talk/execution", json={"inputs": {}})
+    assert response.status_code == 201
+    job_id = response.json()["jobID"]
+
+    text = ""
+    offset = 0
+    while True:
+        response = client.get(
+            f"/jobs/{job_id}/logs", params={"offset": offset, "wait": 5}
+        )
+        assert response.status_code == 200
+        chunk = response.json()
+        text += chunk["text"]
+        offset = chunk["nextOffset"]
+        if chunk["finished"]:
+            break
+
+    assert text == "line 0\nline 1\nline 2\n"
+
+    response = client.get("/jobs/job_99/logs")
+    assert response.status_code == 404
+
+
+def test_job_log_store_does_not_reuse_spill_files(tmp_path):
+    old_store = JobLogStore(max_memory_size=5, spill_dir=tmp_path)
+    old_store.get_or_create("job_0").write("OLD RUN\n")
+
+    new_store = JobLogStore(max_memory_size=5, spill_dir=tmp_path)
+    new_log = new_store.get_or_create("job_0")
+    assert new_log.read(0) == (0, b"")
+    new_log.write("new run\n")
+
+    assert new_log.read(0) == (0, b"new run\n")
+    assert (tmp_path / "job_0.log").read_bytes() == b"new"
+
+
+def test_trim_to_char_boundary():
+    data = "aé€😀".encode("utf-8")
+    texts = [trim_to_char_boundary(data[:n]).decode("utf-8") for n in range(10)]
+    assert texts == ["", "a", "a", "aé", "aé", "aé", "aé€", "aé€", "aé€", "aé€"]
+    assert trim_to_char_boundary(data) == data
+
+
+def test_local_service_job_logs_keep_characters_intact():
+    service = S2GOSLocalService(title="Test")
+    job_log = service.job_logs.get_or_create("job_0")
+    job_log.write("€" * 10)
+    service.jobs["job_0"] = FakeJob()
+    service.jobs["job_0"].job_info = type(
+        "JobInfo", (), {"jobID": "job_0", "status": None}
+    )()
+
+    chunk = asyncio.run(service.get_job_logs("job_0", limit=16))
+
+    assert chunk.text == "€" * 5
+    assert chunk.nextOffset == 15
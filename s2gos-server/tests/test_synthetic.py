@@ -0,0 +1,100 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import os
+import time
+
+import pytest
+from gavicore.models import JobStatus, ProcessRequest
+
+from s2gos_server.services.synthetic import (
+    CONFIG_ENV_VAR,
+    SyntheticProfile,
+    SyntheticService,
+    create_synthetic_registry,
+)
+
+
+@pytest.fixture(autouse=True)
+def restore_config_env():
+    # SyntheticService.configure() sets the variable for worker processes
+    old_value = os.environ.pop(CONFIG_ENV_VAR, None)
+    yield
+    if old_value is None:
+        os.environ.pop(CONFIG_ENV_VAR, None)
+    else:
+        os.environ[CONFIG_ENV_VAR] = old_value
+
+
+def test_create_synthetic_registry_varies_profiles():
+    profile = SyntheticProfile(latency=1.0, output_size=100, spread=0.5, seed=7)
+    registry = create_synthetic_registry(5, profile)
+
+    assert list(registry) == [f"synthetic_00{i}" for i in range(5)]
+    defaults = [
+        registry[process_id].description.inputs["latency"].schema_.default
+        for process_id in registry
+    ]
+    assert all(0.5 <= d <= 1.5 for d in defaults)
+    assert len(set(defaults)) == 5
+
+    registry_2 = create_synthetic_registry(5, profile)
+    assert [
+        registry_2[process_id].description.inputs["latency"].schema_.default
+        for process_id in registry_2
+    ] == defaults
+
+
+def test_synthetic_service_runs_profile():
+    service = SyntheticService(title="Test")
+    service.configure(num_processes=3, latency=0.0, memory_size=10_000, spread=0.0)
+    assert len(service.process_registry) == 3
+
+    request = ProcessRequest(
+        inputs={"latency": 0.05, "cpu_time": 0.02, "output_size": 1000}
+    )
+    start = time.perf_counter()
+    job_info = asyncio.run(service.execute_process("synthetic_002", request))
+    job = service.jobs[job_info.jobID]
+    job.future.result()
+
+    assert time.perf_counter() - start >= 0.07
+    assert job.job_info.status == JobStatus.successful
+    results = asyncio.run(service.get_job_results(job_info.jobID))
+    assert results.root["return_value"] == "x" * 1000
+
+
+def test_create_synthetic_registry_keeps_fractional_latencies():
+    # YAML parses, e.g., `--latency=1` as an integer
+    registry = create_synthetic_registry(5, SyntheticProfile(latency=1, seed=3))
+
+    defaults = [
+        registry[process_id].description.inputs["latency"].schema_.default
+        for process_id in registry
+    ]
+    assert all(isinstance(d, float) for d in defaults)
+    assert any(d != round(d) for d in defaults)
+
+
+def test_synthetic_service_configures_worker_processes():
+    service = SyntheticService(title="Test")
+    service.service_ref = "s2gos_server.services.synthetic:service"
+    service.configure(
+        num_processes=15, latency=0.0, spread=0.0, processes=True, max_workers=1
+    )
+    try:
+        job_info = asyncio.run(
+            service.execute_process("synthetic_014", ProcessRequest(inputs={}))
+        )
+        job = service.jobs[job_info.jobID]
+        job.future.result(timeout=60)
+        assert job.job_info.status == JobStatus.successful, job.job_info
+    finally:
+        service.executor.shutdown()
+
+    # Services created later, e.g., in workers, use the same configuration
+    service_2 = SyntheticService(title="Test")
+    assert service_2.num_processes == 15
+    assert service_2.profile == service.profile
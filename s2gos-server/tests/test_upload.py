@@ -0,0 +1,142 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import base64
+import hashlib
+import json
+import os
+import uuid
+
+import fsspec
+import pytest
+
+from s2gos_server.services.io import PathRef
+from s2gos_server.services.upload import PathRefWriter, upload_file
+
+PART_SIZE = 1024
+
+
+@pytest.fixture
+def target() -> PathRef:
+    return PathRef(f"memory://outputs/{uuid.uuid4().hex}/result.bin")
+
+
+@pytest.fixture
+def memory_fs():
+    return fsspec.filesystem("memory")
+
+
+def test_writer_uploads_parts_and_combines_them(target, memory_fs):
+    data = os.urandom(5 * PART_SIZE + 100)
+
+    with PathRefWriter(target, part_size=PART_SIZE, max_workers=3) as writer:
+        for offset in range(0, len(data), 300):
+            writer.write(data[offset : offset + 300])
+
+    assert memory_fs.cat_file(target.upath.path) == data
+    assert not memory_fs.exists(f"{target.upath.path}.parts")
+
+
+def test_writer_writes_empty_output(target, memory_fs):
+    with PathRefWriter(target, part_size=PART_SIZE):
+        pass
+
+    assert memory_fs.cat_file(target.upath.path) == b""
+
+
+def test_writer_resumes_interrupted_upload(target, memory_fs):
+    data = os.urandom(4 * PART_SIZE)
+
+    with pytest.raises(RuntimeError, match="worker restart"):
+        with PathRefWriter(target, part_size=PART_SIZE, max_workers=1) as writer:
+            writer.write(data[: 2 * PART_SIZE])
+            raise RuntimeError("worker restart")
+
+    manifest = json.loads(
+        memory_fs.cat_file(f"{target.upath.path}.parts/manifest.json")
+    )
+    # Part 2 may have been cancelled before its upload started
+    assert "1" in manifest["parts"]
+    assert not memory_fs.exists(target.upath.path)
+
+    with PathRefWriter(target, part_size=PART_SIZE) as writer:
+        writer.write(data)
+
+    assert writer.skipped_parts == len(manifest["parts"])
+    assert memory_fs.cat_file(target.upath.path) == data
+
+
+def test_writer_reuploads_parts_with_other_checksum(target, memory_fs):
+    with pytest.raises(RuntimeError):
+        with PathRefWriter(target, part_size=PART_SIZE) as writer:
+            writer.write(b"a" * PART_SIZE)
+            raise RuntimeError()
+
+    data = b"b" * 2 * PART_SIZE
+    with PathRefWriter(target, part_size=PART_SIZE) as writer:
+        writer.write(data)
+
+    assert writer.skipped_parts == 0
+    assert memory_fs.cat_file(target.upath.path) == data
+
+
+def test_upload_file(tmp_path, target, memory_fs):
+    data = os.urandom(3 * PART_SIZE + 1)
+    local_path = tmp_path / "result.bin"
+    local_path.write_bytes(data)
+
+    assert upload_file(local_path, target, part_size=PART_SIZE) is target
+    assert memory_fs.cat_file(target.upath.path) == data
+
+
+def test_writer_rejects_small_s3_parts():
+    pytest.importorskip("s3fs")
+    with pytest.raises(ValueError, match="at least"):
+        PathRefWriter(PathRef("s3://bucket/result.bin"), part_size=PART_SIZE)
+
+
+def test_writer_verifies_uploaded_parts(target, memory_fs, monkeypatch):
+    pipe_file = type(memory_fs).pipe_file
+
+    def corrupting_pipe_file(self, path, value, **kwargs):
+        if "part-00002" in path:
+            value = b"x" + bytes(value[1:])
+        return pipe_file(self, path, value, **kwargs)
+
+    monkeypatch.setattr(type(memory_fs), "pipe_file", corrupting_pipe_file)
+    with pytest.raises(OSError, match="Checksum mismatch"):
+        with PathRefWriter(target, part_size=PART_SIZE) as writer:
+            writer.write(os.urandom(3 * PART_SIZE))
+
+
+def test_writer_passes_checksums_to_s3(monkeypatch):
+    pytest.importorskip("s3fs")
+    monkeypatch.setattr(PathRefWriter, "_read_manifest", lambda self: {"parts": {}})
+    monkeypatch.setattr(PathRefWriter, "_write_manifest", lambda self: None)
+    writer = PathRefWriter(PathRef("s3://bucket/result.bin"))
+    calls = []
+    writer._fs = type(
+        "FakeS3", (), {"pipe_file": lambda self, *a, **kw: calls.append((a, kw))}
+    )()
+
+    writer._upload_part(1, b"abc", hashlib.sha256(b"abc").hexdigest())
+
+    (path, data), kwargs = calls[0]
+    assert path.endswith("part-00001") and data == b"abc"
+    assert kwargs == {
+        "ChecksumSHA256": base64.b64encode(hashlib.sha256(b"abc").digest()).decode()
+    }
+
+
+def test_writer_buffers_at_most_one_part(target):
+    with PathRefWriter(target, part_size=PART_SIZE, max_workers=1) as writer:
+        submitted = []
+        submit_part = writer._submit_part
+        writer._submit_part = lambda part: (
+            submitted.append(len(writer._buffer) + len(part)),
+            submit_part(part),
+        )
+        writer.write(os.urandom(10 * PART_SIZE + 1))
+
+    assert submitted and max(submitted) == PART_SIZE
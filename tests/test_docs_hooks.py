@@ -0,0 +1,77 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+HOOK_PATH = "docs/hooks/notebooks_json_output.py"
+
+
+@pytest.fixture
+def hook():
+    # Load the hook like mkdocs does, by file path
+    root = Path(__file__).parent.parent
+    spec = importlib.util.spec_from_file_location(HOOK_PATH, root / HOOK_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[HOOK_PATH] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules[HOOK_PATH]
+
+
+def write_notebook(path: Path, data: dict):
+    cells = [{"cell_type": "code", "outputs": [{"data": data}], "source": ""}]
+    path.write_text(json.dumps({"cells": cells}))
+
+
+def test_hook_processes_changed_notebooks(hook, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "notebooks"
+    (source / "more").mkdir(parents=True)
+    write_notebook(source / "a.ipynb", {"application/json": {"name": "<a>"}})
+    write_notebook(source / "more/b.ipynb", {"application/json": [1, 2]})
+    write_notebook(source / "c.ipynb", {"text/plain": "c"})
+    (source / "image.png").write_bytes(b"png")
+
+    hook.on_pre_build(config=None)
+
+    destination = tmp_path / "docs/notebooks"
+    a = json.loads((destination / "a.ipynb").read_text())
+    assert a["cells"][0]["outputs"][0]["data"]["text/html"] == (
+        "<pre><code class='text-json'>{\n"
+        "  &quot;name&quot;: &quot;&lt;a&gt;&quot;\n"
+        "}</code></pre>"
+    )
+    b = json.loads((destination / "more/b.ipynb").read_text())
+    assert "text/html" in b["cells"][0]["outputs"][0]["data"]
+    assert (destination / "c.ipynb").read_bytes() == (source / "c.ipynb").read_bytes()
+    assert (destination / "image.png").exists()
+    cache = json.loads((destination / hook.CACHE_FILE_NAME).read_text())
+    assert sorted(cache) == ["a.ipynb", "c.ipynb", "more/b.ipynb"]
+
+    # Unchanged notebooks are skipped, changed ones are processed again
+    write_notebook(source / "c.ipynb", {"application/json": None})
+    write_notebook(source / "more/b.ipynb", {"text/plain": "b"})
+    processed = []
+    process_notebooks = hook._process_notebooks
+
+    def _process_notebooks(changed):
+        processed.extend(name for name, _, _ in changed)
+        return process_notebooks(changed)
+
+    monkeypatch.setattr(hook, "_process_notebooks", _process_notebooks)
+    hook.on_pre_build(config=None)
+
+    assert processed == ["c.ipynb", "more/b.ipynb"]
+    c = json.loads((destination / "c.ipynb").read_text())
+    assert c["cells"][0]["outputs"][0]["data"]["text/html"] == (
+        "<pre><code class='text-json'>null</code></pre>"
+    )
+    assert (destination / "more/b.ipynb").read_bytes() == (
+        source / "more/b.ipynb"
+    ).read_bytes()
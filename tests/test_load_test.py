@@ -0,0 +1,67 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+from gavicore.models import JobInfo, JobStatus
+
+TOOL_PATH = "tools/load_test.py"
+
+
+@pytest.fixture
+def load_test():
+    # Load the tool by file path, as `tools` is not an installed package
+    root = Path(__file__).parent.parent
+    spec = importlib.util.spec_from_file_location("load_test", root / TOOL_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["load_test"] = module
+    spec.loader.exec_module(module)
+    yield module
+    del sys.modules["load_test"]
+
+
+class FakeClient:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+
+    async def execute_process(self, process_id, request):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("server down")
+        return new_job_info(process_id, JobStatus.accepted)
+
+    async def get_job(self, job_id):
+        return new_job_info(job_id, JobStatus.successful)
+
+
+def new_job_info(job_id: str, status: JobStatus) -> JobInfo:
+    return JobInfo(jobID=job_id, type="process", status=status)
+
+
+def test_run_step(load_test):
+    result = asyncio.run(
+        load_test.run_step(FakeClient(), ["p1", "p2"], 2, 0.1, poll_interval=0.01)
+    )
+
+    assert result.users == 2
+    assert result.jobs > 0
+    assert result.errors == 0
+    assert result.throughput > 0
+    assert result.to_row()["jobs"] == result.jobs
+
+
+def test_run_step_backs_off_on_errors(load_test, capsys):
+    client = FakeClient(fail=True)
+    result = asyncio.run(load_test.run_step(client, ["p1"], 1, 0.3, poll_interval=0.05))
+
+    # 0.05 + 0.1 + 0.2 seconds of backoff, rather than a tight loop
+    assert result.errors == client.calls
+    assert 2 <= client.calls <= 5
+    assert result.jobs == 0
+    assert "server down" in capsys.readouterr().err
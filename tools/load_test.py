@@ -0,0 +1,292 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Drive load against an S2GOS server and report throughput and latency.
+
+Simulated users concurrently execute randomly chosen processes using the
+async S2GOS client and poll each job until it has finished. The number of
+users is ramped up in steps; for every step, the job throughput and the
+latencies of job submission and completion are reported.
+
+If no `--url` is given, a local server running the synthetic service
+`s2gos_server.services.synthetic:service` is started on the loopback
+interface, so no network access is required. Options after `--` are
+passed to that service. Examples:
+
+    python -m tools.load_test --users 1,4,16 -- --num-processes=50 --latency=1
+
+    python -m tools.load_test --url http://127.0.0.1:8008 --csv curve.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Iterator, Optional
+
+from gavicore.models import JobStatus, ProcessRequest
+
+from s2gos_client import create_async_client
+
+DEFAULT_USERS = "1,2,4,8,16"
+DEFAULT_STEP_DURATION = 10.0
+DEFAULT_POLL_INTERVAL = 0.05
+MAX_ERROR_BACKOFF = 1.0
+DEFAULT_PORT = 8018
+SYNTHETIC_SERVICE = "s2gos_server.services.synthetic:service"
+
+_TERMINAL_STATUSES = (JobStatus.successful, JobStatus.failed, JobStatus.dismissed)
+
+
+@dataclass
+class StepResult:
+    """The measurements of one load step."""
+
+    users: int
+    jobs: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    throughput: float = 0.0
+    submit_p50: float = 0.0
+    submit_p95: float = 0.0
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+    latency_p99: float = 0.0
+    latency_max: float = 0.0
+    _submit_latencies: list[float] = field(default_factory=list, repr=False)
+    _latencies: list[float] = field(default_factory=list, repr=False)
+
+    def finish(self, elapsed: float):
+        self.elapsed = elapsed
+        self.jobs = len(self._latencies)
+        self.throughput = self.jobs / elapsed if elapsed > 0 else 0.0
+        self.submit_p50 = _percentile(self._submit_latencies, 50)
+        self.submit_p95 = _percentile(self._submit_latencies, 95)
+        self.latency_p50 = _percentile(self._latencies, 50)
+        self.latency_p95 = _percentile(self._latencies, 95)
+        self.latency_p99 = _percentile(self._latencies, 99)
+        self.latency_max = max(self._latencies, default=0.0)
+
+    def to_row(self) -> dict:
+        return {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+
+
+async def run_step(
+    client,
+    process_ids: list[str],
+    users: int,
+    duration: float,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    seed: int = 0,
+) -> StepResult:
+    """Let `users` users execute jobs for `duration` seconds."""
+    result = StepResult(users=users)
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    deadline = start + duration
+
+    async def user():
+        backoff = poll_interval
+        while time.perf_counter() < deadline:
+            process_id = rng.choice(process_ids)
+            job_start = time.perf_counter()
+            try:
+                job_info = await client.execute_process(
+                    process_id, ProcessRequest(inputs={})
+                )
+                result._submit_latencies.append(time.perf_counter() - job_start)
+                while job_info.status not in _TERMINAL_STATUSES:
+                    await asyncio.sleep(poll_interval)
+                    job_info = await client.get_job(job_info.jobID)
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
+                result.errors += 1
+                # Do not hammer a failing server
+                await asyncio.sleep(min(backoff, deadline - time.perf_counter()))
+                backoff = min(2 * backoff, MAX_ERROR_BACKOFF)
+                continue
+            backoff = poll_interval
+            if job_info.status == JobStatus.successful:
+                result._latencies.append(time.perf_counter() - job_start)
+            else:
+                result.errors += 1
+
+    await asyncio.gather(*(user() for _ in range(users)))
+    result.finish(time.perf_counter() - start)
+    return result
+
+
+async def run_load_test(
+    url: str,
+    users: list[int],
+    step_duration: float = DEFAULT_STEP_DURATION,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    seed: int = 0,
+) -> list[StepResult]:
+    """Run one load step per number of users and print the results."""
+    # Measure the server, not the cache of finished jobs
+    client = create_async_client(api_url=url, auth_type="none", cache_size=0)
+    try:
+        processes = await client.get_processes()
+        process_ids = [p.id for p in processes.processes]
+        if not process_ids:
+            raise RuntimeError(f"Server at {url} has no processes")
+        print(f"Using {len(process_ids)} process(es) of {url}")
+        print(
+            f"{'users':>5} {'jobs':>6} {'errors':>6} {'jobs/s':>8}"
+            f" {'submit p50':>10} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+        )
+        results = []
+        for step, num_users in enumerate(users):
+            result = await run_step(
+                client,
+                process_ids,
+                num_users,
+                step_duration,
+                poll_interval=poll_interval,
+                seed=seed + step,
+            )
+            print(
+                f"{result.users:>5} {result.jobs:>6} {result.errors:>6}"
+                f" {result.throughput:>8.2f} {result.submit_p50:>10.3f}"
+                f" {result.latency_p50:>8.3f} {result.latency_p95:>8.3f}"
+                f" {result.latency_p99:>8.3f} {result.latency_max:>8.3f}"
+            )
+            results.append(result)
+        return results
+    finally:
+        await client.close()
+
+
+@contextmanager
+def local_server(port: int, service_args: list[str]) -> Iterator[str]:
+    """Run a server with the synthetic service on the loopback interface."""
+    url = f"http://127.0.0.1:{port}"
+    command = [
+        sys.executable,
+        "-m",
+        "s2gos_server.cli",
+        "run",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--",
+        SYNTHETIC_SERVICE,
+        *service_args,
+    ]
+    process = subprocess.Popen(command)
+    try:
+        _wait_until_ready(process, url)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def _wait_until_ready(process: subprocess.Popen, url: str, timeout: float = 60.0):
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with code {process.returncode}")
+        try:
+            with urllib.request.urlopen(f"{url}/", timeout=1.0) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            pass
+        time.sleep(0.1)
+    raise TimeoutError(f"No response from {url} within {timeout} seconds")
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(percent) - 1]
+
+
+def _write_csv(path: str, results: list[StepResult]):
+    rows = [result.to_row() for result in results]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Drive load against an S2GOS server.",
+        epilog="Arguments after '--' are passed to the local synthetic service.",
+    )
+    parser.add_argument(
+        "--url", help="Server URL. If omitted, a local synthetic server is started."
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_PORT,
+        help="Port of the local synthetic server.",
+    )
+    parser.add_argument(
+        "--users",
+        default=DEFAULT_USERS,
+        help="Comma-separated numbers of concurrent users, one load step each.",
+    )
+    parser.add_argument(
+        "--step-duration",
+        type=float,
+        default=DEFAULT_STEP_DURATION,
+        help="Seconds per load step.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help="Seconds between job status requests.",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument("--csv", help="File that receives the results as CSV.")
+    parser.add_argument(
+        "service_args", nargs="*", help="Options of the synthetic service."
+    )
+    args = parser.parse_args(argv)
+
+    users = [int(u) for u in args.users.split(",")]
+
+    def run(url: str) -> list[StepResult]:
+        return asyncio.run(
+            run_load_test(
+                url,
+                users,
+                step_duration=args.step_duration,
+                poll_interval=args.poll_interval,
+                seed=args.seed,
+            )
+        )
+
+    if args.url:
+        results = run(args.url)
+    else:
+        with local_server(args.port, args.service_args) as url:
+            results = run(url)
+    if args.csv:
+        _write_csv(args.csv, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#  Copyright (c) 2026 by ESA DTE-S2GOS team and contributors
+#  Permissions are hereby granted under the terms of the Apache 2.0 License:
+#  https://opensource.org/license/apache-2-0.
+
+"""Measure the time-to-first-200 of the S2GOS server.
+
+Starts the given server command, polls the server's capabilities
+endpoint `/` until it responds with HTTP 200, and reports the elapsed
+time. The server is stopped afterwards. Examples:
+
+    python -m tools.measure_startup -- \\
+        s2gos-server run -- s2gos_server.services.testing:service
+
+    python -m tools.measure_startup --runs 5 -- \\
+        docker run --rm -p 8008:8008 \\
+        -e EOZILLA_SERVICE=s2gos_server.services.testing:service \\
+        quay.io/s2gos/s2gos-server:dev
+"""
+
+import argparse
+import statistics
+import subprocess
+import time
+import urllib.error
+import urllib.request
+
+DEFAULT_URL = "http://127.0.0.1:8008/"
+DEFAULT_TIMEOUT = 120.0
+POLL_INTERVAL = 0.05
+
+
+def measure_startup(
+    command: list[str], url: str = DEFAULT_URL, timeout: float = DEFAULT_TIMEOUT
+) -> float:
+    """Run `command` and return the seconds until `url` responds with 200."""
+    start_time = time.perf_counter()
+    process = subprocess.Popen(command)
+    try:
+        while True:
+            elapsed = time.perf_counter() - start_time
+            if process.poll() is not None:
+                raise RuntimeError(
+                    f"Server exited with code {process.returncode}"
+                    f" after {elapsed:.2f} seconds"
+                )
+            if elapsed > timeout:
+                raise TimeoutError(f"No response from {url} within {timeout} seconds")
+            try:
+                with urllib.request.urlopen(url, timeout=1.0) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start_time
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                pass
+            time.sleep(POLL_INTERVAL)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the time-to-first-200 of a server command."
+    )
+    parser.add_argument("--url", default=DEFAULT_URL, help="URL to poll.")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="Seconds to wait for the first 200 response.",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=1, help="Number of server starts to measure."
+    )
+    parser.add_argument("command", nargs="+", help="Server command to run.")
+    args = parser.parse_args()
+
+    durations = []
+    for run in range(args.runs):
+        duration = measure_startup(args.command, url=args.url, timeout=args.timeout)
+        print(f"Run {run + 1}: time-to-first-200 = {duration:.3f} s")
+        durations.append(duration)
+    if len(durations) > 1:
+        print(
+            f"Median: {statistics.median(durations):.3f} s,"
+            f" min: {min(durations):.3f} s, max: {max(durations):.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()